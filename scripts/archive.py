@@ -6,11 +6,11 @@ from __future__ import annotations
 import os, re, tempfile
 from collections import defaultdict
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from pathlib import Path
 
 from utils import parse_tasks
-from task_lines import remove_task_line
+from task_lines import remove_task_lines
 
 
 DEPARTMENT_DISPLAY = {"HR": "HR/People"}
@@ -60,8 +60,8 @@ def archive_week(tasks_file: Path, personal: bool) -> dict:
     if not tasks_file.exists():
         return {'error': f"Tasks file not found: {tasks_file}", 'archived': 0, 'removed': 0}
     
-    content = tasks_file.read_text()
-    tasks_data = parse_tasks(content, personal, "objectives")
+    board_content = tasks_file.read_text()
+    tasks_data = parse_tasks(board_content, personal, "objectives")
     
     completed_by_dept = defaultdict(list)
     all_tasks = tasks_data.get('all', [])
@@ -113,18 +113,17 @@ def archive_week(tasks_file: Path, personal: bool) -> dict:
     
     atomic_write(archive_file, content)
     
-    updated_content = tasks_file.read_text()
-    removed = 0
     records_to_remove = [
         record
         for dept_records in completed_by_dept.values()
         for record in dept_records
     ]
-    for record in sorted(records_to_remove, key=lambda r: r.line_number or 0, reverse=True):
-        updated = remove_task_line(updated_content, record.raw_line, record.line_number)
-        if updated is not None:
-            updated_content = updated
-            removed += 1
+    # Line numbers were recorded against ``board_content``, so the board is
+    # not re-read before removing the archived lines.
+    updated_content, removed = remove_task_lines(
+        board_content,
+        ((record.raw_line, record.line_number) for record in records_to_remove),
+    )
     
     if removed > 0:
         atomic_write(tasks_file, updated_content)
@@ -248,7 +247,7 @@ def archive_stats(archive_dir: Path, period: str) -> dict:
                 date_match = re.search(r'✅\s*(\d{4}-\d{2}-\d{2})', line)
                 if date_match:
                     try:
-                        item_date = datetime.strptime(date_match.group(1), '%Y-%m-%d').date()
+                        item_date = date.fromisoformat(date_match.group(1))
                         if start_date <= item_date <= end_date:
                             counts[current_dept] += 1
                             total += 1
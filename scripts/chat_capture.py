@@ -41,6 +41,8 @@ MAX_TEXT_CHARS = 4096
 MAX_STORED_PHRASE_CHARS = 512
 MISS_DEDUPE_WINDOW = timedelta(hours=1)
 TRUE_VALUES = {"1", "true", "yes", "on", "enabled"}
+# Non-fuzzy match types that always qualify a match for review.
+_REVIEWABLE_MATCH_TYPES = frozenset({"exact-id-or-link", "issue-number-fallback", "normalized-title"})
 
 # Candidate denoising/ranking heuristics only; never use them as trust gates or
 # authorization to write.
@@ -135,9 +137,9 @@ def _line_for_phrase(phrase: str, raw_text: str) -> dict[str, Any]:
 
 
 def _is_reviewable_match(match: dict[str, Any]) -> bool:
-    match_types = set(match.get("match_types") or [match.get("match_type")])
+    match_types = match.get("match_types") or (match.get("match_type"),)
     return bool(
-        match_types & {"exact-id-or-link", "issue-number-fallback", "normalized-title"}
+        not _REVIEWABLE_MATCH_TYPES.isdisjoint(match_types)
         or float(match.get("score") or 0.0) >= FUZZY_REVIEW_THRESHOLD
     )
 
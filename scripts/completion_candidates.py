@@ -17,6 +17,7 @@ from evidence_matching import (
     extract_done_lines,
     extract_inline_identifiers,
     match_evidence_line,
+    match_evidence_lines,
     normalize_title,
     safe_load_task_records,
 )
@@ -363,13 +364,13 @@ def _match_evidence_lines(content: str, source: dict[str, Any], *, personal: boo
     records = safe_load_task_records(personal)
     catalog = build_task_catalog(records)
     matched = []
-    for line in parsed:
-        match = match_evidence_line(
-            line,
-            catalog,
-            auto_threshold=FUZZY_EVIDENCE_LINK_THRESHOLD,
-            review_threshold=FUZZY_REVIEW_THRESHOLD,
-        )
+    all_matches = match_evidence_lines(
+        parsed,
+        catalog,
+        auto_threshold=FUZZY_EVIDENCE_LINK_THRESHOLD,
+        review_threshold=FUZZY_REVIEW_THRESHOLD,
+    )
+    for line, match in zip(parsed, all_matches, strict=False):
         match["line_number"] = line.get("line_number")
         if (match.get("match_metadata") or {}).get("decision") == "no-match":
             continue
@@ -5,8 +5,9 @@ Helpers for extracting completed actions from daily notes.
 
 import json
 import re
-from datetime import date, datetime
+from datetime import date, timedelta
 from pathlib import Path
+from typing import Iterator
 
 
 ACTION_VERBS = (
@@ -28,6 +29,36 @@ ACTION_VERB_RE = re.compile(
 NOTES_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})\.md$")
 
 
+# Ranges up to about a year open each day's note by name; longer ranges list
+# the directory once instead of probing thousands of absent dates.
+_DIRECT_NOTE_LOOKUP_DAYS = 400
+
+
+def _note_files_in_range(notes_dir: Path, start_date: date, end_date: date) -> Iterator[Path]:
+    """Yield ``YYYY-MM-DD.md`` note paths dated within the range, oldest first.
+
+    Short ranges yield the expected path for each day without listing the
+    directory; callers already skip paths that cannot be read, so days without
+    a note cost one failed open.
+    """
+    span_days = (end_date - start_date).days + 1
+    if span_days <= _DIRECT_NOTE_LOOKUP_DAYS:
+        for offset in range(span_days):
+            yield notes_dir / f"{(start_date + timedelta(days=offset)).isoformat()}.md"
+        return
+
+    for notes_file in sorted(notes_dir.glob("*.md")):
+        match = NOTES_DATE_RE.fullmatch(notes_file.name)
+        if not match:
+            continue
+        try:
+            file_date = date.fromisoformat(match.group(1))
+        except ValueError:
+            continue
+        if start_date <= file_date <= end_date:
+            yield notes_file
+
+
 def _clean_action_line(line: str) -> str:
     """Strip common completion markers and bullet prefixes."""
     cleaned = line.strip()
@@ -78,19 +109,7 @@ def extract_completed_actions(
     completed_actions: list[str] = []
     seen: set[str] = set()
 
-    for notes_file in sorted(notes_dir.glob("*.md")):
-        match = NOTES_DATE_RE.fullmatch(notes_file.name)
-        if not match:
-            continue
-
-        try:
-            file_date = datetime.strptime(match.group(1), "%Y-%m-%d").date()
-        except ValueError:
-            continue
-
-        if file_date < start_date or file_date > end_date:
-            continue
-
+    for notes_file in _note_files_in_range(notes_dir, start_date, end_date):
         try:
             content = notes_file.read_text()
         except (PermissionError, UnicodeDecodeError, OSError):
@@ -119,47 +138,35 @@ def extract_completed_actions(
 _TIMESTAMPED_RE = re.compile(r"^-\s+(\d{2}:\d{2})\s+✅\s+(.+)")
 
 
-def extract_completed_tasks(
+def iter_completed_tasks(
     notes_dir: Path,
     start_date: date,
     end_date: date,
-) -> list[dict]:
-    """Extract completed tasks from daily notes as rich dicts.
+) -> Iterator[dict]:
+    """Yield completed tasks from daily notes as rich dicts.
 
     Each dict has keys: title, done, completed_date, timestamp, section,
     area, priority, due, recur.  Metadata is recovered from the JSON
     context line that log_done() writes directly below the action line.
 
-    Returns a deduplicated list preserving first-seen order.
-    Deduplicates by (title, completed_date) so recurring tasks completed
+    Items are yielded in first-seen order, one note file at a time, and
+    deduplicated by (title, completed_date) so recurring tasks completed
     on different days are counted separately.
     """
     if start_date > end_date:
         start_date, end_date = end_date, start_date
 
     if not notes_dir.exists() or not notes_dir.is_dir():
-        return []
+        return
 
-    results: list[dict] = []
     seen: set[tuple[str, str]] = set()  # (title_casefolded, date)
 
-    for notes_file in sorted(notes_dir.glob("*.md")):
-        match = NOTES_DATE_RE.fullmatch(notes_file.name)
-        if not match:
-            continue
-
-        try:
-            file_date = datetime.strptime(match.group(1), "%Y-%m-%d").date()
-        except ValueError:
-            continue
-
-        if file_date < start_date or file_date > end_date:
-            continue
-
+    for notes_file in _note_files_in_range(notes_dir, start_date, end_date):
         try:
             lines = notes_file.read_text().splitlines()
         except (PermissionError, UnicodeDecodeError, OSError):
             continue
+        note_date = notes_file.stem
 
         i = 0
         while i < len(lines):
@@ -169,20 +176,20 @@ def extract_completed_tasks(
                 if _is_completed_action_line(lines[i]):
                     title = _clean_action_line(lines[i])
                     if title:
-                        dedupe_key = (title.casefold(), match.group(1))
+                        dedupe_key = (title.casefold(), note_date)
                         if dedupe_key not in seen:
                             seen.add(dedupe_key)
-                            results.append({
+                            yield {
                                 "title": title,
                                 "done": True,
-                                "completed_date": match.group(1),
+                                "completed_date": note_date,
                                 "timestamp": None,
                                 "section": None,
                                 "area": None,
                                 "priority": None,
                                 "due": None,
                                 "recur": None,
-                            })
+                            }
                 i += 1
                 continue
 
@@ -201,21 +208,31 @@ def extract_completed_tasks(
                 except (json.JSONDecodeError, ValueError):
                     pass
 
-            dedupe_key = (title.casefold(), match.group(1))
+            dedupe_key = (title.casefold(), note_date)
             if dedupe_key not in seen:
                 seen.add(dedupe_key)
-                results.append({
+                yield {
                     "title": title,
                     "done": True,
-                    "completed_date": match.group(1),
+                    "completed_date": note_date,
                     "timestamp": timestamp,
                     "section": context.get("section"),
                     "area": context.get("area"),
                     "priority": None,
                     "due": context.get("due"),
                     "recur": context.get("recur"),
-                })
+                }
 
             i += 1
 
-    return results
+
+def extract_completed_tasks(
+    notes_dir: Path,
+    start_date: date,
+    end_date: date,
+) -> list[dict]:
+    """Extract completed tasks from daily notes as a deduplicated list.
+
+    See ``iter_completed_tasks`` for the item shape and ordering.
+    """
+    return list(iter_completed_tasks(notes_dir, start_date, end_date))
@@ -10,7 +10,6 @@ Manages a separate Delegated.md file with sections:
 Operations: list, add, complete, extend, take-back.
 """
 
-import json
 import os
 import re
 import tempfile
@@ -189,6 +188,7 @@ def list_items(path: Path, overdue_only: bool = False) -> list[dict]:
 
 def list_items_json(path: Path, overdue_only: bool = False) -> str:
     """List delegated items as JSON."""
+    from utils import dump_json
     items = list_items(path, overdue_only)
     output = []
     for it in items:
@@ -202,7 +202,7 @@ def list_items_json(path: Path, overdue_only: bool = False) -> str:
             'overdue': _is_overdue(it),
             'status': it.get('status', 'active'),
         })
-    return json.dumps(output, indent=2)
+    return dump_json(output)
 
 
 def add_item(path: Path, title: str, assignee: str,
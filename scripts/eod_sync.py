@@ -114,6 +114,8 @@ def similarity(a: str, b: str) -> float:
     na, nb = normalize(a), normalize(b)
     if not na or not nb:
         return 0.0
+    if na == nb:
+        return 1.0
     return SequenceMatcher(None, na, nb).ratio()
 
 
@@ -4,8 +4,10 @@
 from __future__ import annotations
 
 import re
+from bisect import insort
 from difflib import SequenceMatcher
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable
 
 from task_records import active_records, record_to_task_dict, task_records as build_task_records
 from utils import get_tasks_file
@@ -28,49 +30,63 @@ def safe_load_task_records(personal: bool = False) -> list:
         return []
 
 
+# Checkbox/done markers become a space; bold/underline/strike markup is dropped.
+_TITLE_MARKUP_RE = re.compile(r"(\[x\]|\[ \]|✅|☑️)|\*\*|__|~~")
+# Any run of punctuation and/or whitespace collapses to one space ("/" and "-" kept).
+_TITLE_SEPARATOR_RE = re.compile(r"[^\w/-]+")
+
+
+def _title_markup_repl(match: re.Match[str]) -> str:
+    return " " if match.group(1) else ""
+
+
+@lru_cache(maxsize=4096)
 def normalize_title(title: str) -> str:
     lowered = (title or "").strip().casefold()
-    lowered = re.sub(r"\[x\]|\[ \]|✅|☑️", " ", lowered)
-    lowered = re.sub(r"\*\*|__|~~", "", lowered)
-    lowered = re.sub(r"[^\w\s/-]", " ", lowered)
-    lowered = re.sub(r"\s+", " ", lowered)
+    lowered = _TITLE_MARKUP_RE.sub(_title_markup_repl, lowered)
+    lowered = _TITLE_SEPARATOR_RE.sub(" ", lowered)
     return lowered.strip()
 
 
+_INLINE_ID_RE = re.compile(
+    r"\b(?:id|task_id|task)::\s*([A-Za-z0-9._:-]*[A-Za-z0-9._-])(?=\s|$|[),.;!?])",
+    re.IGNORECASE,
+)
+_URL_RE = re.compile(r"https?://[^\s)>\]]+")
+_GITHUB_ISSUE_URL_RE = re.compile(r"^https?://(?:www\.)?github\.com/([^/\s]+)/([^/\s]+)/issues/(\d+)\b")
+_GITHUB_ISSUE_REF_RE = re.compile(r"\b([A-Za-z0-9_.-]+)/([A-Za-z0-9_.-]+)#(\d+)\b")
+_ISSUE_NUMBER_RE = re.compile(r"(?<!\w)#(\d+)\b")
+
+
 def extract_inline_identifiers(text: str) -> dict[str, set[str]]:
     exact_identifiers: set[str] = set()
     fallback_identifiers: set[str] = set()
     if not text:
         return {"exact": exact_identifiers, "fallback": fallback_identifiers}
 
-    for match in re.findall(
-        r"\b(?:id|task_id|task)::\s*([A-Za-z0-9._:-]*[A-Za-z0-9._-])(?=\s|$|[),.;!?])",
-        text,
-        flags=re.IGNORECASE,
-    ):
-        exact_identifiers.add(match.casefold())
-
-    for url in re.findall(r"https?://[^\s)>\]]+", text):
-        lowered_url = url.casefold()
-        exact_identifiers.add(lowered_url)
-        github_issue_match = re.search(
-            r"^https?://(?:www\.)?github\.com/([^/\s]+)/([^/\s]+)/issues/(\d+)\b",
-            lowered_url,
-        )
-        if github_issue_match:
-            owner, repo, issue_num = github_issue_match.groups()
-            exact_identifiers.add(f"gh:{owner}/{repo}#{issue_num}")
+    # Each pattern needs a literal marker; skip the regex when the marker is absent,
+    # which is the common case for plain task titles.
+    if "::" in text:
+        for match in _INLINE_ID_RE.findall(text):
+            exact_identifiers.add(match.casefold())
+
+    if "://" in text:
+        for url in _URL_RE.findall(text):
+            lowered_url = url.casefold()
+            exact_identifiers.add(lowered_url)
+            github_issue_match = _GITHUB_ISSUE_URL_RE.search(lowered_url)
+            if github_issue_match:
+                owner, repo, issue_num = github_issue_match.groups()
+                exact_identifiers.add(f"gh:{owner}/{repo}#{issue_num}")
+                fallback_identifiers.add(f"gh-issue-num:{issue_num}")
+
+    if "#" in text:
+        for owner, repo, issue_num in _GITHUB_ISSUE_REF_RE.findall(text):
+            exact_identifiers.add(f"gh:{owner.casefold()}/{repo.casefold()}#{issue_num}")
             fallback_identifiers.add(f"gh-issue-num:{issue_num}")
 
-    for owner, repo, issue_num in re.findall(
-        r"\b([A-Za-z0-9_.-]+)/([A-Za-z0-9_.-]+)#(\d+)\b",
-        text,
-    ):
-        exact_identifiers.add(f"gh:{owner.casefold()}/{repo.casefold()}#{issue_num}")
-        fallback_identifiers.add(f"gh-issue-num:{issue_num}")
-
-    for match in re.findall(r"(?<!\w)#(\d+)\b", text):
-        fallback_identifiers.add(f"gh-issue-num:{match}")
+        for match in _ISSUE_NUMBER_RE.findall(text):
+            fallback_identifiers.add(f"gh-issue-num:{match}")
 
     return {"exact": exact_identifiers, "fallback": fallback_identifiers}
 
@@ -92,28 +108,34 @@ def canonical_record(record) -> dict[str, Any]:
     return record_to_task_dict(record)
 
 
+_DONE_CHECKBOX_RE = re.compile(r"^\s*[-*+]\s+\[(x|X| )\]\s+")
+# Leading bullet, checkbox, HH:MM[:SS] timestamp and ✅ in one pass. The
+# (?=\S) lookaheads keep a box/timestamp that ends the line (e.g. "- [x] ") as
+# the title, exactly as when each prefix was stripped from the trimmed line.
+_DONE_PREFIX_RE = re.compile(
+    r"^\s*(?:[-*+]\s+)?(?:\[(?:x|X| )\]\s+(?=\S))?(?:\d{1,2}:\d{2}(?::\d{2})?\s+(?=\S))?(?:✅\s*)?"
+)
+_DONE_STAMP_RE = re.compile(r"\s*✅\s*\d{4}-\d{2}-\d{2}\s*$")
+
+
 def extract_done_lines(content: str) -> list[dict[str, Any]]:
+    return extract_done_lines_from(content.splitlines())
+
+
+def extract_done_lines_from(lines: Iterable[str]) -> list[dict[str, Any]]:
+    """``extract_done_lines`` over already-split lines (1-based line numbers)."""
     parsed: list[dict[str, Any]] = []
-    for line_number, raw in enumerate(content.splitlines(), start=1):
+    for line_number, raw in enumerate(lines, start=1):
         line = raw.strip()
         if not line:
             continue
 
-        is_checkbox = bool(re.match(r"^\s*[-*+]\s+\[(?:x|X| )\]\s+", raw))
-        is_checked = bool(re.match(r"^\s*[-*+]\s+\[(?:x|X)\]\s+", raw))
-
-        is_plain_bullet = bool(re.match(r"^\s*[-*+]\s+", raw))
-        if is_checkbox and not is_checked:
+        # Unchecked checkboxes are open work, not done evidence.
+        checkbox = _DONE_CHECKBOX_RE.match(raw)
+        if checkbox and checkbox.group(1) == " ":
             continue
-        if not is_checkbox and not is_plain_bullet and not line.startswith("✅"):
-            pass
-
-        cleaned = re.sub(r"^\s*[-*+]\s+", "", raw).strip()
-        cleaned = re.sub(r"^\[(?:x|X| )\]\s+", "", cleaned)
-        cleaned = re.sub(r"^\d{1,2}:\d{2}(?::\d{2})?\s+", "", cleaned)
-        cleaned = re.sub(r"^✅\s*", "", cleaned)
-        cleaned = re.sub(r"\s*✅\s*\d{4}-\d{2}-\d{2}\s*$", "", cleaned)
-        cleaned = cleaned.strip()
+
+        cleaned = _DONE_STAMP_RE.sub("", _DONE_PREFIX_RE.sub("", raw, count=1)).strip()
         if not cleaned:
             continue
 
@@ -134,9 +156,71 @@ def extract_done_lines(content: str) -> list[dict[str, Any]]:
 def fuzzy_score(left: str, right: str) -> float:
     if not left or not right:
         return 0.0
+    if left == right:
+        return 1.0
     return SequenceMatcher(None, left, right).ratio()
 
 
+def _fuzzy_rank(item: tuple[float, str, dict[str, Any]]) -> tuple[float, str]:
+    return (-item[0], item[1])
+
+
+def _top_fuzzy_matches(
+    normalized_title: str,
+    catalog: list[dict[str, Any]],
+    limit: int,
+) -> list[tuple[float, str, dict[str, Any]]]:
+    """Return the ``limit`` best ``(score, sort_key, candidate)`` fuzzy hits.
+
+    Same result as scoring every candidate with ``fuzzy_score`` and sorting by
+    ``(-score, sort_key)``. difflib's cheap upper bounds (``real_quick_ratio``
+    and ``quick_ratio``) skip the full ``ratio()`` for candidates that cannot
+    reach the current ``limit``-th best score.
+    """
+    return _top_fuzzy_matches_many([normalized_title], catalog, limit)[0]
+
+
+def _top_fuzzy_matches_many(
+    normalized_titles: list[str],
+    catalog: list[dict[str, Any]],
+    limit: int,
+) -> list[list[tuple[float, str, dict[str, Any]]]]:
+    """``_top_fuzzy_matches`` for several titles against one catalog.
+
+    Walks the catalog once: each candidate title is loaded as difflib's second
+    sequence (which builds its match index) a single time and compared against
+    every query, instead of being re-indexed once per query.
+    """
+    tops: list[list[tuple[float, str, dict[str, Any]]]] = [[] for _ in normalized_titles]
+    if limit <= 0:
+        return tops
+    matcher = SequenceMatcher(None)
+    for candidate in catalog:
+        other = candidate["normalized_title"]
+        sort_key = _candidate_sort_key(candidate)
+        if other:
+            matcher.set_seq2(other)
+        for normalized_title, top in zip(normalized_titles, tops):
+            if not normalized_title or not other:
+                score = 0.0
+            elif normalized_title == other:
+                score = 1.0
+            else:
+                matcher.set_seq1(normalized_title)
+                if len(top) == limit:
+                    floor = top[-1][0]
+                    if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                        continue
+                score = matcher.ratio()
+            if len(top) == limit:
+                worst_score, worst_key, _ = top[-1]
+                if score < worst_score or (score == worst_score and sort_key >= worst_key):
+                    continue
+                top.pop()
+            insort(top, (score, sort_key, candidate), key=_fuzzy_rank)
+    return tops
+
+
 def build_task_catalog(records: list) -> list[dict[str, Any]]:
     catalog: list[dict[str, Any]] = []
     for record in active_records(records):
@@ -188,6 +272,30 @@ def _candidate_identity(candidate: dict[str, Any]) -> str:
     )
 
 
+def _catalog_index(catalog: list[dict[str, Any]]) -> dict[str, dict[str, list[int]]]:
+    """Map exact ids, fallback ids and normalized titles to catalog positions."""
+    index: dict[str, dict[str, list[int]]] = {"exact": {}, "fallback": {}, "title": {}}
+    for position, candidate in enumerate(catalog):
+        for identifier in candidate["exact_identifiers"]:
+            index["exact"].setdefault(identifier, []).append(position)
+        for identifier in candidate["fallback_identifiers"]:
+            index["fallback"].setdefault(identifier, []).append(position)
+        index["title"].setdefault(candidate["normalized_title"], []).append(position)
+    return index
+
+
+def _indexed_candidates(
+    keys,
+    table: dict[str, list[int]],
+    catalog: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Catalog entries filed under any of ``keys``, ordered like ``sorted(catalog, key=_candidate_sort_key)``."""
+    positions: set[int] = set()
+    for key in keys:
+        positions.update(table.get(key, ()))
+    return sorted((catalog[position] for position in sorted(positions)), key=_candidate_sort_key)
+
+
 def match_evidence_all(
     line: dict[str, Any],
     catalog: list[dict[str, Any]],
@@ -229,24 +337,17 @@ def match_evidence_all(
         if match_type not in existing["match_types"]:
             existing["match_types"].append(match_type)
 
-    for candidate in sorted(catalog, key=_candidate_sort_key):
-        if line["exact_identifiers"] and (line["exact_identifiers"] & candidate["exact_identifiers"]):
-            add_match(candidate, score=1.0, match_type="exact-id-or-link")
+    index = _catalog_index(catalog)
+    for candidate in _indexed_candidates(line["exact_identifiers"], index["exact"], catalog):
+        add_match(candidate, score=1.0, match_type="exact-id-or-link")
 
-    for candidate in sorted(catalog, key=_candidate_sort_key):
-        if line["fallback_identifiers"] and (line["fallback_identifiers"] & candidate["fallback_identifiers"]):
-            add_match(candidate, score=0.6, match_type="issue-number-fallback")
+    for candidate in _indexed_candidates(line["fallback_identifiers"], index["fallback"], catalog):
+        add_match(candidate, score=0.6, match_type="issue-number-fallback")
 
-    for candidate in sorted(catalog, key=_candidate_sort_key):
-        if candidate["normalized_title"] == line["normalized_title"]:
-            add_match(candidate, score=1.0, match_type="normalized-title")
+    for candidate in _indexed_candidates((line["normalized_title"],), index["title"], catalog):
+        add_match(candidate, score=1.0, match_type="normalized-title")
 
-    scored = []
-    for candidate in catalog:
-        score = fuzzy_score(line["normalized_title"], candidate["normalized_title"])
-        scored.append((score, _candidate_sort_key(candidate), candidate))
-    scored.sort(key=lambda item: (-item[0], item[1]))
-    for score, _sort_key, candidate in scored[:max(0, fuzzy_limit)]:
+    for score, _sort_key, candidate in _top_fuzzy_matches(line["normalized_title"], catalog, fuzzy_limit):
         add_match(candidate, score=score, match_type="fuzzy")
 
     matches = sorted(
@@ -265,79 +366,77 @@ def match_evidence_all(
     }
 
 
-def match_evidence_line(
+def _evidence_result(
     line: dict[str, Any],
-    catalog: list[dict[str, Any]],
-    auto_threshold: float,
-    review_threshold: float,
+    *,
+    candidate: dict[str, Any] | None,
+    score: float,
+    decision: str,
+    match_type: str,
 ) -> dict[str, Any]:
-    def result(
-        *,
-        candidate: dict[str, Any] | None,
-        score: float,
-        decision: str,
-        match_type: str,
-    ) -> dict[str, Any]:
-        return {
-            "raw_line": line["raw_line"],
-            "parsed_title": line["title"],
-            "normalized_title": line["normalized_title"],
-            "canonical_task": candidate["canonical"] if candidate and decision != "no-match" else None,
-            "match_metadata": {
-                "matched_task_id": (
-                    candidate["canonical"]["task_id"] if candidate and decision != "no-match" else None
-                ),
-                "score": round(float(score), 4),
-                "decision": decision,
-                "match_type": match_type,
-            },
-        }
+    return {
+        "raw_line": line["raw_line"],
+        "parsed_title": line["title"],
+        "normalized_title": line["normalized_title"],
+        "canonical_task": candidate["canonical"] if candidate and decision != "no-match" else None,
+        "match_metadata": {
+            "matched_task_id": (
+                candidate["canonical"]["task_id"] if candidate and decision != "no-match" else None
+            ),
+            "score": round(float(score), 4),
+            "decision": decision,
+            "match_type": match_type,
+        },
+    }
 
-    exact_matches = [
-        candidate
-        for candidate in catalog
-        if line["exact_identifiers"] and (line["exact_identifiers"] & candidate["exact_identifiers"])
-    ]
+
+def _exact_evidence_match(
+    line: dict[str, Any],
+    catalog: list[dict[str, Any]],
+    index: dict[str, dict[str, list[int]]],
+) -> dict[str, Any] | None:
+    """Resolve ``line`` by identifier, issue number or exact title; ``None`` if fuzzy is needed."""
+    exact_matches = _indexed_candidates(line["exact_identifiers"], index["exact"], catalog)
     if exact_matches:
-        chosen = sorted(exact_matches, key=_candidate_sort_key)[0]
-        return result(
+        chosen = exact_matches[0]
+        return _evidence_result(
+            line,
             candidate=chosen,
             score=1.0,
             decision="evidence-link",
             match_type="exact-id-or-link",
         )
 
-    fallback_matches = [
-        candidate
-        for candidate in catalog
-        if line["fallback_identifiers"] and (line["fallback_identifiers"] & candidate["fallback_identifiers"])
-    ]
+    fallback_matches = _indexed_candidates(line["fallback_identifiers"], index["fallback"], catalog)
     if fallback_matches:
-        chosen = sorted(fallback_matches, key=_candidate_sort_key)[0]
-        return result(
+        chosen = fallback_matches[0]
+        return _evidence_result(
+            line,
             candidate=chosen,
             score=0.6,
             decision="needs-review",
             match_type="issue-number-fallback",
         )
 
-    exact_title_matches = [
-        candidate for candidate in catalog if candidate["normalized_title"] == line["normalized_title"]
-    ]
+    exact_title_matches = _indexed_candidates((line["normalized_title"],), index["title"], catalog)
     if exact_title_matches:
-        chosen = sorted(exact_title_matches, key=_candidate_sort_key)[0]
-        return result(
+        chosen = exact_title_matches[0]
+        return _evidence_result(
+            line,
             candidate=chosen,
             score=1.0,
             decision="evidence-link",
             match_type="normalized-title",
         )
+    return None
 
-    scored = []
-    for candidate in catalog:
-        score = fuzzy_score(line["normalized_title"], candidate["normalized_title"])
-        scored.append((score, _candidate_sort_key(candidate), candidate))
-    scored.sort(key=lambda item: (-item[0], item[1]))
+
+def _fuzzy_evidence_result(
+    line: dict[str, Any],
+    scored: list[tuple[float, str, dict[str, Any]]],
+    auto_threshold: float,
+    review_threshold: float,
+) -> dict[str, Any]:
     best_score, _, best = scored[0] if scored else (0.0, "", None)
 
     decision = "no-match"
@@ -346,7 +445,36 @@ def match_evidence_line(
     elif best and best_score >= review_threshold:
         decision = "needs-review"
 
-    return result(candidate=best, score=best_score, decision=decision, match_type="fuzzy")
+    return _evidence_result(line, candidate=best, score=best_score, decision=decision, match_type="fuzzy")
+
+
+def match_evidence_line(
+    line: dict[str, Any],
+    catalog: list[dict[str, Any]],
+    auto_threshold: float,
+    review_threshold: float,
+) -> dict[str, Any]:
+    exact = _exact_evidence_match(line, catalog, _catalog_index(catalog))
+    if exact is not None:
+        return exact
+    scored = _top_fuzzy_matches(line["normalized_title"], catalog, 1)
+    return _fuzzy_evidence_result(line, scored, auto_threshold, review_threshold)
+
+
+def match_evidence_lines(
+    lines: list[dict[str, Any]],
+    catalog: list[dict[str, Any]],
+    auto_threshold: float,
+    review_threshold: float,
+) -> list[dict[str, Any]]:
+    """``match_evidence_line`` for every line, fuzzy-scoring the leftovers in one batch."""
+    catalog_index = _catalog_index(catalog)
+    matched: list[dict[str, Any] | None] = [_exact_evidence_match(line, catalog, catalog_index) for line in lines]
+    pending = [position for position, match in enumerate(matched) if match is None]
+    scored_rows = _top_fuzzy_matches_many([lines[position]["normalized_title"] for position in pending], catalog, 1)
+    for position, scored in zip(pending, scored_rows):
+        matched[position] = _fuzzy_evidence_result(lines[position], scored, auto_threshold, review_threshold)
+    return matched
 
 
 def match_evidence_content(
@@ -359,15 +487,12 @@ def match_evidence_content(
     parsed = extract_done_lines(content)
     records = safe_load_task_records(personal)
     catalog = build_task_catalog(records)
-    matched = [
-        match_evidence_line(
-            line,
-            catalog,
-            auto_threshold=auto_threshold,
-            review_threshold=review_threshold,
-        )
-        for line in parsed
-    ]
+    matched = match_evidence_lines(
+        parsed,
+        catalog,
+        auto_threshold=auto_threshold,
+        review_threshold=review_threshold,
+    )
     for line, match in zip(parsed, matched, strict=False):
         match["line_number"] = line.get("line_number")
     return parsed, matched
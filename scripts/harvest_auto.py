@@ -112,8 +112,7 @@ def _closed_issue_entries(match: dict[str, Any], catalog: list[dict[str, Any]])
         return []
     entries: list[dict[str, Any]] = []
     for entry in catalog:
-        entry_exact = set(entry.get("exact_identifiers") or set())
-        if exact & entry_exact:
+        if not exact.isdisjoint(entry.get("exact_identifiers") or ()):
             entries.append(entry)
     return entries
 
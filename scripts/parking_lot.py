@@ -345,19 +345,17 @@ def add_item(tasks_file: Path, title: str, dept: str | None = None,
     return f"✅ Added to Parking Lot: {title} [{len(items) + 1}/{cap}]"
 
 
-def promote_item(tasks_file: Path, item_id: int) -> str:
-    """Move item from parking lot to objectives/high-priority section."""
-    content = tasks_file.read_text()
-    lines = content.split('\n')
+def _promote_in_lines(lines: list[str], item_id: int) -> tuple[bool, str]:
+    """Move one parking lot item within ``lines``; return (promoted, message)."""
     start, end = _find_parking_lot_bounds(lines)
 
     if start == -1:
-        return "❌ No Parking Lot section found."
+        return False, "❌ No Parking Lot section found."
 
     items = _parse_items(lines, start, end)
     target = next((it for it in items if it['id'] == item_id), None)
     if not target:
-        return f"❌ Item #{item_id} not found in Parking Lot."
+        return False, f"❌ Item #{item_id} not found in Parking Lot."
 
     # Remove from parking lot
     block_end = _item_block_end(lines, target['line_num'])
@@ -395,8 +393,35 @@ def promote_item(tasks_file: Path, item_id: int) -> str:
             insert_at = len(lines)
 
     lines[insert_at:insert_at] = promoted_block
-    _atomic_write(tasks_file, '\n'.join(lines))
-    return f"✅ Promoted from Parking Lot: {target['title']}"
+    return True, f"✅ Promoted from Parking Lot: {target['title']}"
+
+
+def promote_item(tasks_file: Path, item_id: int) -> str:
+    """Move item from parking lot to objectives/high-priority section."""
+    lines = tasks_file.read_text().split('\n')
+    promoted, message = _promote_in_lines(lines, item_id)
+    if promoted:
+        _atomic_write(tasks_file, '\n'.join(lines))
+    return message
+
+
+def promote_items(tasks_file: Path, count: int) -> list[str]:
+    """Promote up to ``count`` items from the top of the parking lot.
+
+    Equivalent to calling ``promote_item(tasks_file, 1)`` ``count`` times, but
+    reads and writes the board once. Stops at the first item that cannot be
+    promoted and returns the messages for the items that were.
+    """
+    lines = tasks_file.read_text().split('\n')
+    messages = []
+    for _ in range(count):
+        promoted, message = _promote_in_lines(lines, 1)
+        if not promoted:
+            break
+        messages.append(message)
+    if messages:
+        _atomic_write(tasks_file, '\n'.join(lines))
+    return messages
 
 
 def drop_item(tasks_file: Path, item_id: int,
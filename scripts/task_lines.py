@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 
 def line_index(lines: list[str], raw_line: str, line_number: int | None) -> int | None:
     if line_number is None:
@@ -41,24 +43,128 @@ def _task_block_end(lines: list[str], target_index: int, target_indent: int) ->
     return remove_until
 
 
-def task_line_block(content: str, raw_line: str, line_number: int | None) -> str | None:
-    lines = content.split("\n")
+def _block_bounds(lines: list[str], raw_line: str, line_number: int | None) -> tuple[int, int] | None:
     target_index = line_index(lines, raw_line, line_number)
     if target_index is None:
         return None
-    target_indent = leading_indent_width(raw_line)
-    remove_until = _task_block_end(lines, target_index, target_indent)
-    return "\n".join(lines[target_index:remove_until])
+    return target_index, _task_block_end(lines, target_index, leading_indent_width(raw_line))
+
+
+def _line_offset(content: str, raw_line: str, line_number: int | None) -> int | None:
+    """``line_index`` as a string offset, found without splitting ``content``."""
+    if line_number is None or line_number < 1 or "\n" in raw_line:
+        return None
+    target_newlines = line_number - 1
+    newlines = 0
+    counted_to = 0
+    pos = content.find(raw_line)
+    while pos != -1:
+        newlines += content.count("\n", counted_to, pos)
+        counted_to = pos
+        if newlines > target_newlines:
+            return None
+        if newlines == target_newlines:
+            end = pos + len(raw_line)
+            at_line_start = pos == 0 or content[pos - 1] == "\n"
+            at_line_end = end == len(content) or content[end] == "\n"
+            return pos if at_line_start and at_line_end else None
+        pos = content.find(raw_line, pos + 1)
+    return None
+
+
+def _line_at(content: str, pos: int) -> tuple[str, int]:
+    newline = content.find("\n", pos)
+    return (content[pos:] if newline == -1 else content[pos:newline]), newline
+
+
+def _task_block_end_offset(content: str, start: int, target_indent: int) -> int | None:
+    """Offset of the first line after the block at ``start``; None if it runs to the end.
+
+    Same rules as ``_task_block_end``, walking ``content`` in place.
+    """
+    newline = content.find("\n", start)
+    while newline != -1:
+        pos = newline + 1
+        line, newline = _line_at(content, pos)
+        if not line.strip():
+            ahead, ahead_newline = line, newline
+            while not ahead.strip() and ahead_newline != -1:
+                ahead, ahead_newline = _line_at(content, ahead_newline + 1)
+            if ahead.strip() and leading_indent_width(ahead) > target_indent:
+                continue
+            return pos
+        if leading_indent_width(line) > target_indent:
+            continue
+        return pos
+    return None
+
+
+def _block_offsets(content: str, raw_line: str, line_number: int | None) -> tuple[int, int | None] | None:
+    start = _line_offset(content, raw_line, line_number)
+    if start is None:
+        return None
+    return start, _task_block_end_offset(content, start, leading_indent_width(raw_line))
+
+
+def _block_text(content: str, start: int, end: int | None) -> str:
+    return content[start:] if end is None else content[start:end - 1]
+
+
+def _without_block(content: str, start: int, end: int | None) -> str:
+    if end is not None:
+        return content[:start] + content[end:]
+    # The block ran to the end: also drop the newline that preceded it.
+    return content[:start - 1] if start else ""
+
+
+def task_line_block(content: str, raw_line: str, line_number: int | None) -> str | None:
+    bounds = _block_offsets(content, raw_line, line_number)
+    if bounds is None:
+        return None
+    return _block_text(content, *bounds)
 
 
 def remove_task_line(content: str, raw_line: str, line_number: int | None) -> str | None:
+    bounds = _block_offsets(content, raw_line, line_number)
+    if bounds is None:
+        return None
+    return _without_block(content, *bounds)
+
+
+def remove_task_lines(content: str, targets: Iterable[tuple[str, int | None]]) -> tuple[str, int]:
+    """Remove several task blocks from ``content`` in one pass.
+
+    ``targets`` are ``(raw_line, line_number)`` pairs recorded against this same
+    ``content``. They are applied bottom-up by line number, each verified like
+    ``remove_task_line`` against the lines left so far; targets that no longer
+    match are skipped. Returns the new content and how many targets were
+    removed. Same result as calling ``remove_task_line`` for each in that
+    order, but the board is split and joined once.
+    """
     lines = content.split("\n")
-    target_index = line_index(lines, raw_line, line_number)
-    if target_index is None:
+    removed = 0
+    for raw_line, line_number in sorted(targets, key=lambda target: target[1] or 0, reverse=True):
+        bounds = _block_bounds(lines, raw_line, line_number)
+        if bounds is None:
+            continue
+        start, end = bounds
+        del lines[start:end]
+        removed += 1
+    if not removed:
+        return content, 0
+    return "\n".join(lines), removed
+
+
+def split_task_block(content: str, raw_line: str, line_number: int | None) -> tuple[str, str] | None:
+    """Return ``(block, remaining_content)`` for a task and its children.
+
+    Equivalent to ``task_line_block`` plus ``remove_task_line`` but locates the
+    block once, for callers that need both the removed text and the result.
+    """
+    bounds = _block_offsets(content, raw_line, line_number)
+    if bounds is None:
         return None
-    target_indent = leading_indent_width(raw_line)
-    remove_until = _task_block_end(lines, target_index, target_indent)
-    return "\n".join(lines[:target_index] + lines[remove_until:])
+    return _block_text(content, *bounds), _without_block(content, *bounds)
 
 
 def replace_task_line(
@@ -67,9 +173,7 @@ def replace_task_line(
     replacement: str,
     line_number: int | None,
 ) -> str | None:
-    lines = content.split("\n")
-    target_index = line_index(lines, raw_line, line_number)
-    if target_index is None:
+    start = _line_offset(content, raw_line, line_number)
+    if start is None:
         return None
-    lines[target_index] = replacement
-    return "\n".join(lines)
+    return content[:start] + replacement + content[start + len(raw_line):]
@@ -16,7 +16,7 @@ import task_records as task_record_module
 from autonomy import board_snapshot, resolve_board_restore
 from locks import sidecar_flock
 from log_done import log_task_completed
-from task_lines import line_index, remove_task_line, replace_task_line, task_line_block
+from task_lines import line_index, remove_task_line, replace_task_line, split_task_block
 from task_records import active_records, load_records
 from task_ledger import append_event, ledger_path, new_event, read_events
 from utils import next_recurrence_date, _atomic_write
@@ -24,6 +24,8 @@ from utils import next_recurrence_date, _atomic_write
 INLINE_FIELD_RE = re.compile(r"\s+[A-Za-z_][A-Za-z0-9_-]*::")
 RECURRENCE_RE = re.compile(r"\brecur::\s*(?!(?:\s|[A-Za-z_][A-Za-z0-9_-]*::))([^\n]+?)(?=\s+[A-Za-z_][A-Za-z0-9_-]*::|\s*[🗓️📅]|$)")
 DUE_RE = re.compile(r"(?:🗓️\s*|📅\s*)(\d{4}-\d{2}-\d{2})")
+CALENDAR_DUE_RE = re.compile(r"🗓️\s*\d{4}-\d{2}-\d{2}")
+DATE_EMOJI_DUE_RE = re.compile(r"📅\s*\d{4}-\d{2}-\d{2}")
 # An EOD ``carry`` stamps this inline marker so the morning standup can surface the
 # task as carried-from-yesterday. It is plain inline metadata (KTD-7): no new board
 # status field, the task stays ACTIVE.
@@ -42,10 +44,13 @@ def board_flock(target: Path) -> Iterator[None]:
 
 def _set_due_date(raw_line: str, due_date: str) -> str:
     marker = f"🗓️{due_date}"
-    if re.search(r"🗓️\s*\d{4}-\d{2}-\d{2}", raw_line):
-        return re.sub(r"🗓️\s*\d{4}-\d{2}-\d{2}", marker, raw_line, count=1)
-    if re.search(r"📅\s*\d{4}-\d{2}-\d{2}", raw_line):
-        return re.sub(r"📅\s*\d{4}-\d{2}-\d{2}", f"📅 {due_date}", raw_line, count=1)
+    # Splice at the first match's span: one scan instead of search followed by sub.
+    match = CALENDAR_DUE_RE.search(raw_line)
+    if match:
+        return f"{raw_line[:match.start()]}{marker}{raw_line[match.end():]}"
+    match = DATE_EMOJI_DUE_RE.search(raw_line)
+    if match:
+        return f"{raw_line[:match.start()]}📅 {due_date}{raw_line[match.end():]}"
     match = INLINE_FIELD_RE.search(raw_line)
     if match:
         return f"{raw_line[:match.start()]} {marker}{raw_line[match.start():]}"
@@ -142,7 +147,7 @@ def _resolve_by_id(task_id: str, personal: bool = False):
     try:
         tasks_file, content, records = load_records(personal)
     except FileNotFoundError as exc:
-        return None, "", None, {
+        return None, "", [], None, {
             "ok": False,
             "error": {
                 "code": "tasks-file-missing",
@@ -152,7 +157,7 @@ def _resolve_by_id(task_id: str, personal: bool = False):
         }
     matches = [record for record in active_records(records) if record.canonical_id == task_id]
     if len(matches) != 1:
-        return tasks_file, content, None, {
+        return tasks_file, content, records, None, {
             "ok": False,
             "error": {
                 "code": "canonical-id-resolution-failed",
@@ -161,7 +166,7 @@ def _resolve_by_id(task_id: str, personal: bool = False):
                 "repair_choices": ["identity-audit", "identity-repair --dry-run"],
             },
         }
-    return tasks_file, content, matches[0], None
+    return tasks_file, content, records, matches[0], None
 
 
 def _reverted_transition_ids(events: list[dict[str, Any]]) -> set[str]:
@@ -200,11 +205,13 @@ def _terminal_noop_result(
     task_id: str,
     personal: bool,
     terminal_states: set[str],
+    records: list | None = None,
 ) -> dict | None:
-    try:
-        _resolved_file, _content, records = load_records(personal)
-    except FileNotFoundError:
-        records = []
+    if records is None:
+        try:
+            _resolved_file, _content, records = load_records(personal)
+        except FileNotFoundError:
+            records = []
 
     matches = [record for record in records if record.canonical_id == task_id]
     done_matches = [record for record in matches if record.done]
@@ -250,6 +257,7 @@ def _maybe_terminal_noop(
     personal: bool,
     error: dict,
     terminal_states: set[str],
+    records: list | None = None,
 ) -> dict | None:
     detail = error.get("error") or {}
     if (
@@ -257,7 +265,7 @@ def _maybe_terminal_noop(
         or detail.get("matches_found") != 0
     ):
         return None
-    return _terminal_noop_result(tasks_file, task_id, personal, terminal_states)
+    return _terminal_noop_result(tasks_file, task_id, personal, terminal_states, records)
 
 
 def _same_path(left: Path, right: Path) -> bool:
@@ -378,7 +386,9 @@ def complete_by_id(
     extra_events_factory: Callable[[dict], list[dict]] | None = None,
 ) -> dict:
     lock_file = _tasks_file_for_board(personal)
-    initial_tasks_file, _initial_content, initial_record, initial_error = _resolve_by_id(task_id, personal)
+    initial_tasks_file, _initial_content, initial_records, initial_record, initial_error = _resolve_by_id(
+        task_id, personal
+    )
     if initial_error:
         noop = _maybe_terminal_noop(
             initial_tasks_file or lock_file,
@@ -386,14 +396,17 @@ def complete_by_id(
             personal,
             initial_error,
             {"done", "cancelled"},
+            initial_records,
         )
         return noop or initial_error
     target_raw_line = initial_record.raw_line
 
     with board_flock(lock_file):
-        tasks_file, content, record, error = _resolve_by_id(task_id, personal)
+        tasks_file, content, records, record, error = _resolve_by_id(task_id, personal)
         if error:
-            noop = _maybe_terminal_noop(tasks_file or lock_file, task_id, personal, error, {"done", "cancelled"})
+            noop = _maybe_terminal_noop(
+                tasks_file or lock_file, task_id, personal, error, {"done", "cancelled"}, records
+            )
             return noop or error
         # Concurrency guard (recurring-safe): if a winner completed this occurrence
         # while we waited on the board lock, our pre-lock target line is either gone
@@ -402,7 +415,7 @@ def complete_by_id(
         # so no-op instead of double-completing / advancing the recurrence twice.
         # (Verified by test_concurrent_complete_recurring_serializes_to_one_completion.)
         if record.raw_line != target_raw_line:
-            noop = _terminal_noop_result(tasks_file, task_id, personal, {"done", "cancelled"})
+            noop = _terminal_noop_result(tasks_file, task_id, personal, {"done", "cancelled"}, records)
             if noop:
                 return noop
             return {
@@ -443,8 +456,8 @@ def complete_by_id(
                     },
                 }
         else:
-            removed_block = task_line_block(content, record.raw_line, record.line_number)
-            new_content = remove_task_line(content, record.raw_line, record.line_number)
+            split = split_task_block(content, record.raw_line, record.line_number)
+            removed_block, new_content = split if split is not None else (None, None)
         if new_content is None:
             return {
                 "ok": False,
@@ -552,9 +565,11 @@ def cancel_by_id(
 ) -> dict:
     lock_file = _tasks_file_for_board(personal)
     with board_flock(lock_file):
-        tasks_file, content, record, error = _resolve_by_id(task_id, personal)
+        tasks_file, content, records, record, error = _resolve_by_id(task_id, personal)
         if error:
-            noop = _maybe_terminal_noop(tasks_file or lock_file, task_id, personal, error, {"done", "cancelled"})
+            noop = _maybe_terminal_noop(
+                tasks_file or lock_file, task_id, personal, error, {"done", "cancelled"}, records
+            )
             return noop or error
         ledger_error = _preflight_ledger(tasks_file)
         if ledger_error:
@@ -931,7 +946,7 @@ def reschedule_by_id(
 
     lock_file = _tasks_file_for_board(personal)
     with board_flock(lock_file):
-        tasks_file, content, record, error = _resolve_by_id(task_id, personal)
+        tasks_file, content, _records, record, error = _resolve_by_id(task_id, personal)
         if error:
             return error
         ledger_error = _preflight_ledger(tasks_file)
@@ -1005,7 +1020,7 @@ def carry_by_id(
     """
     lock_file = _tasks_file_for_board(personal)
     with board_flock(lock_file):
-        tasks_file, content, record, error = _resolve_by_id(task_id, personal)
+        tasks_file, content, _records, record, error = _resolve_by_id(task_id, personal)
         if error:
             return error
         ledger_error = _preflight_ledger(tasks_file)
@@ -1081,7 +1096,7 @@ def drop_by_id(
     """
     lock_file = _tasks_file_for_board(personal)
     with board_flock(lock_file):
-        tasks_file, content, record, error = _resolve_by_id(task_id, personal)
+        tasks_file, content, _records, record, error = _resolve_by_id(task_id, personal)
         if error:
             return error
         ledger_error = _preflight_ledger(tasks_file)
@@ -3,7 +3,7 @@
 Task Tracker CLI - Supports both Work and Personal tasks.
 
 Usage:
-    tasks.py list [--priority high|medium|low] [--status open|done] [--completed-since 24h|7d|30d] [--due today|this-week|overdue|due-or-overdue]
+    tasks.py list [--priority high|medium|low] [--status open|done] [--completed-since 24h|7d|30d [--no-notes]] [--due today|this-week|overdue|due-or-overdue]
     tasks.py --personal list
     tasks.py add "Task title" [--priority high|medium|low] [--due YYYY-MM-DD]
     tasks.py done "task_id"
@@ -13,9 +13,11 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import os
 import re
+import shutil
 import sys
 import uuid
 from datetime import date, datetime, timedelta
@@ -24,30 +26,6 @@ from urllib.parse import quote
 
 sys.path.insert(0, str(Path(__file__).parent))
 import error_envelope
-from daily_notes import extract_completed_tasks
-from candidate_review import candidate_review_summary
-from evidence_matching import (
-    FUZZY_EVIDENCE_LINK_THRESHOLD,
-    FUZZY_REVIEW_THRESHOLD,
-    build_task_catalog,
-    canonical_record as _canonical_record,
-    extract_done_lines,
-    match_evidence_line,
-    safe_load_task_records as _safe_load_task_records,
-)
-from standup_common import get_calendar_events, flatten_calendar_events
-import delegation
-from task_identity import audit_payload, print_json as print_identity_json
-from task_audit import collect_task_audit, task_audit_summary
-from task_lines import remove_task_line
-from task_repair import repair_missing_ids
-from task_transitions import block_unsafe_query, cancel_by_id, complete_by_id, print_result, revert_completion
-from rollover import run_rollover
-from task_records import (
-    active_records,
-    record_to_task_dict,
-    task_records,
-)
 from utils import (
     detect_format,
     get_tasks_file,
@@ -55,15 +33,49 @@ from utils import (
     parse_tasks,
     load_tasks,
     check_due_date,
+    parse_due_date,
     get_current_quarter,
     ARCHIVE_DIR,
     get_objective_progress,
+    dump_json,
     _atomic_write,
 )
 
 COMPLETION_ID_RE = re.compile(r"evt_[0-9a-f]{32}")
+TASK_ID_QUERY_RE = re.compile(r"[A-Za-z0-9._:-]+")
+CARRIED_TASK_ID_RE = re.compile(r'(?:task_id|id)::\s*([A-Za-z0-9._:-]*[A-Za-z0-9._-])')
+ISO_WEEK_RE = re.compile(r"(\d{4})-W(\d{2})")
+MEETING_STATUS_RE = re.compile(r'status::(scheduled|done|canceled|blocked)', re.IGNORECASE)
+
+# Board headers used to pick where ``add`` inserts a new task line.
+PRIORITY_HEADER_RES = {
+    'high': re.compile(r'^##\s+🔴(?:\s|$)', re.MULTILINE),
+    'medium': re.compile(r'^##\s+🟡(?:\s|$)', re.MULTILINE),
+    'low': re.compile(r'^##\s+⚪(?:\s|$)', re.MULTILINE),
+}
+H2_HEADER_RE = re.compile(r'^##\s+', re.MULTILINE)
+ALL_TASKS_HEADER_RE = re.compile(r'^##\s+(?:📋\s+)?All Tasks(?:\s|$)', re.MULTILINE)
+DEPT_HEADER_RE = re.compile(r'^###\s+.+$', re.MULTILINE)
+
 TASK_PRIMITIVES_SCHEMA_VERSION = "v1"
 
+# ``list --priority`` -> (board section, priority tags) a task may match on.
+LIST_PRIORITY_FILTERS = {
+    'high': ('q1', frozenset({'high', 'urgent'})),
+    'medium': ('q2', frozenset({'medium'})),
+    'low': ('backlog', frozenset({'low'})),
+}
+
+# argparse ``choices`` shared by several subcommands. Tuples (not sets) keep
+# the order argparse shows in usage/help and error messages.
+_PRIORITY_CHOICES = ('high', 'medium', 'low')
+_PARKING_PRIORITY_CHOICES = ('urgent', *_PRIORITY_CHOICES)
+_COMPLETED_WINDOW_CHOICES = ('24h', '7d', '30d')
+_DAY_WINDOW_CHOICES = ('today', 'yesterday')
+_STANDUP_DO_SECTIONS = frozenset({'q1', 'q2', 'today'})
+# Key order of the calendar-sync primitive's ``lifecycle_map``.
+_MEETING_LIFECYCLE_STATUSES = ('scheduled', 'done', 'blocked', 'canceled')
+
 
 def _env_int(name: str, default: int) -> int:
     try:
@@ -74,33 +86,19 @@ def _env_int(name: str, default: int) -> int:
 
 def list_tasks(args):
     """List tasks with optional filters."""
+    from daily_notes import extract_completed_tasks
+
     _, tasks_data = load_tasks(args.personal)
     tasks = tasks_data['all']
-    
-    # Apply filters
-    filtered = tasks
 
-    if args.status == 'done':
-        filtered = [t for t in filtered if t['done']]
-    elif args.status == 'open':
-        filtered = [t for t in filtered if not t['done']]
-    
-    if args.priority:
-        priority_map = {
-            'high': {'section': 'q1', 'tags': {'high', 'urgent'}},
-            'medium': {'section': 'q2', 'tags': {'medium'}},
-            'low': {'section': 'backlog', 'tags': {'low'}},
-        }
-        target = priority_map.get(args.priority.lower())
-        if target:
-            filtered = [
-                t for t in filtered
-                if t.get('section') == target['section'] or t.get('priority') in target['tags']
-            ]
-    
+    # Resolve every filter once, then keep each task in a single pass.
+    want_done = {'done': True, 'open': False}.get(args.status)
+    priority_target = LIST_PRIORITY_FILTERS.get(args.priority.lower()) if args.priority else None
+    due_today = None
     if args.due:
-        filtered = [t for t in filtered if check_due_date(t.get('due', ''), args.due)]
-
+        from cos_config import local_today
+        due_today = local_today()
+    cutoff_date = None
     if args.completed_since:
         # Note: timestamps are date-only (YYYY-MM-DD), so "24h" actually
         # means "yesterday or today" and "7d" means "last 7 calendar days".
@@ -111,21 +109,30 @@ def list_tasks(args):
         }[args.completed_since]
         cutoff_date = datetime.now().date() - timedelta(days=cutoff_days)
 
-        # Completion windows only apply to done tasks.
-        filtered = [t for t in filtered if t.get('done')]
-
-        recent_done = []
-        for task in filtered:
-            completed_date = task.get('completed_date')
+    filtered = []
+    for t in tasks:
+        if want_done is not None and bool(t['done']) != want_done:
+            continue
+        if priority_target:
+            target_section, target_tags = priority_target
+            if t.get('section') != target_section and t.get('priority') not in target_tags:
+                continue
+        if args.due and not check_due_date(t.get('due', ''), args.due, today=due_today):
+            continue
+        if cutoff_date is not None:
+            # Completion windows only apply to done tasks.
+            completed_date = t.get('completed_date') if t.get('done') else None
             if not completed_date:
                 continue
             try:
-                parsed_date = datetime.strptime(completed_date, '%Y-%m-%d').date()
+                parsed_date = date.fromisoformat(completed_date)
             except ValueError:
                 continue
-            if parsed_date >= cutoff_date:
-                recent_done.append(task)
+            if parsed_date < cutoff_date:
+                continue
+        filtered.append(t)
 
+    if cutoff_date is not None and not getattr(args, 'no_notes', False):
         # Augment with daily notes completions
         notes_dir_raw = os.getenv("TASK_TRACKER_DAILY_NOTES_DIR")
         if notes_dir_raw:
@@ -134,12 +141,8 @@ def list_tasks(args):
                 start_date=cutoff_date,
                 end_date=datetime.now().date(),
             )
-            board_titles = {t['title'].casefold() for t in recent_done}
-            for nt in notes_tasks:
-                if nt['title'].casefold() not in board_titles:
-                    recent_done.append(nt)
-
-        filtered = recent_done
+            board_titles = frozenset(t['title'].casefold() for t in filtered)
+            filtered.extend(nt for nt in notes_tasks if nt['title'].casefold() not in board_titles)
     
     if not filtered:
         task_type = "Personal" if args.personal else "Work"
@@ -181,7 +184,7 @@ def _add_destination_is_active(priority: str | None, content: str) -> bool:
         return True
     # The destination section is nominally inactive (Backlog) -- but only honour
     # that if the board actually has a Backlog header for the writer to target.
-    has_backlog = re.search(r'^##\s+⚪(?:\s|$)', content, re.MULTILINE) is not None
+    has_backlog = PRIORITY_HEADER_RES['low'].search(content) is not None
     return not has_backlog
 
 
@@ -260,33 +263,29 @@ def _insert_active_task(content: str, priority: str | None, area: str | None,
     when no insertion anchor exists. Shared by capture, promote and swap so all
     three insert into the same place.
     """
-    priority_patterns = {
-        'high': r'^##\s+🔴(?:\s|$)',
-        'medium': r'^##\s+🟡(?:\s|$)',
-        'low': r'^##\s+⚪(?:\s|$)',
-    }
-    priority_pattern = priority_patterns.get(priority, r'^##\s+🟡(?:\s|$)')
+    priority_header_re = PRIORITY_HEADER_RES.get(priority, PRIORITY_HEADER_RES['medium'])
 
+    # Both helpers walk ``text`` in place from ``start_pos`` (always a line
+    # start) instead of slicing or splitting the rest of the board.
     def _next_h2_pos(text: str, start_pos: int) -> int:
-        match = re.search(r'^##\s+', text[start_pos:], re.MULTILINE)
+        match = H2_HEADER_RE.search(text, start_pos)
         if not match:
             return len(text)
-        return start_pos + match.start()
+        return match.start()
 
     def _advance_after_header(text: str, start_pos: int) -> int:
-        insert_at = start_pos
-        remaining = text[insert_at:]
-        lines = remaining.split('\n')
-        skip_lines = 0
-        for line in lines:
-            if line.strip() == '' or line.startswith('**') or line.startswith('>'):
-                skip_lines += 1
-            else:
-                break
-        return insert_at + sum(len(lines[i]) + 1 for i in range(skip_lines))
+        pos = start_pos
+        while True:
+            line_end = text.find('\n', pos)
+            line = text[pos:] if line_end == -1 else text[pos:line_end]
+            if not (line.strip() == '' or line.startswith('**') or line.startswith('>')):
+                return pos
+            if line_end == -1:
+                return len(text)
+            pos = line_end + 1
 
     # 1) Legacy priority anchors (## 🔴 / ## 🟡 / ## ⚪)
-    section_match = re.search(priority_pattern, content, re.MULTILINE)
+    section_match = priority_header_re.search(content)
     insert_pos = None
     if section_match:
         header_end = content.find('\n', section_match.start())
@@ -297,7 +296,7 @@ def _insert_active_task(content: str, priority: str | None, area: str | None,
         insert_pos = _advance_after_header(content, header_end)
     else:
         # 2) Fallback: ## 📋 All Tasks (or plain ## All Tasks)
-        all_tasks_match = re.search(r'^##\s+(?:📋\s+)?All Tasks(?:\s|$)', content, re.MULTILINE)
+        all_tasks_match = ALL_TASKS_HEADER_RE.search(content)
         if all_tasks_match:
             all_tasks_header_end = content.find('\n', all_tasks_match.start())
             if all_tasks_header_end == -1:
@@ -313,7 +312,7 @@ def _insert_active_task(content: str, priority: str | None, area: str | None,
                 area_re = re.escape(area.strip())
                 dept_match = re.search(rf'^###.*\b{area_re}\b.*$', all_tasks_body, re.MULTILINE | re.IGNORECASE)
             if not dept_match:
-                dept_match = re.search(r'^###\s+.+$', all_tasks_body, re.MULTILINE)
+                dept_match = DEPT_HEADER_RE.search(all_tasks_body)
 
             if dept_match:
                 dept_header_end = all_tasks_header_end + dept_match.end()
@@ -325,7 +324,7 @@ def _insert_active_task(content: str, priority: str | None, area: str | None,
                 insert_pos = _advance_after_header(content, all_tasks_header_end)
         else:
             # 3) Final fallback: first department header anywhere
-            dept_match = re.search(r'^###\s+.+$', content, re.MULTILINE)
+            dept_match = DEPT_HEADER_RE.search(content)
             if dept_match:
                 dept_header_end = content.find('\n', dept_match.start())
                 if dept_header_end == -1:
@@ -336,6 +335,10 @@ def _insert_active_task(content: str, priority: str | None, area: str | None,
 
     if insert_pos is None:
         return None
+    if insert_pos == len(content) and content and not content.endswith('\n'):
+        # The anchor is the board's last line with no trailing newline: start
+        # a new line rather than gluing the task onto it.
+        return content + '\n' + task_line + '\n'
     return content[:insert_pos] + task_line + '\n' + content[insert_pos:]
 
 
@@ -507,9 +510,7 @@ def _promote_parked_onto_board(tasks_file, fmt: str, item_id: int, *, personal:
     estimate = parked.get('estimate')
     # Preserve the parked task's canonical id through the promote so it round-trips
     # (capture -> promote, swap-out -> promote-in keep one stable identity).
-    id_match = re.search(
-        r'(?:task_id|id)::\s*([A-Za-z0-9._:-]*[A-Za-z0-9._-])', parked.get('raw_line') or ''
-    )
+    id_match = CARRIED_TASK_ID_RE.search(parked.get('raw_line') or '')
     carried_id = id_match.group(1) if id_match else None
 
     # Promotion gate: re-run the canonical capacity check for THIS task. A personal
@@ -579,6 +580,7 @@ def _park_active_task(tasks_file, fmt: str, out_id: str, *, personal: bool):
     """
     from parking_lot import add_item
     from task_lines import remove_task_line
+    from task_records import active_records, task_records
 
     content = tasks_file.read_text()
     records = task_records(content, personal=personal, fmt=fmt)
@@ -656,9 +658,9 @@ def _parked_item_id_for(content: str, canonical_id: str) -> int | None:
     start, end = _find_parking_lot_bounds(lines)
     if start == -1:
         return None
+    id_re = re.compile(rf'(?:task_id|id)::\s*{re.escape(canonical_id)}\b')
     for item in _parse_items(lines, start, end):
-        raw = item.get('raw_line') or ''
-        if re.search(rf'(?:task_id|id)::\s*{re.escape(canonical_id)}\b', raw):
+        if id_re.search(item.get('raw_line') or ''):
             return item['id']
     return None
 
@@ -674,6 +676,9 @@ def swap_tasks(args):
     promote-in's gate passes) run, followed by the promote-in. A bad out/in id
     also refuses before any write.
     """
+    from task_lines import remove_task_line
+    from task_records import active_records, task_records
+
     tasks_file, fmt = get_tasks_file(args.personal)
     if not tasks_file.exists():
         print(f"❌ Tasks file not found: {tasks_file}")
@@ -774,8 +779,10 @@ def swap_tasks(args):
 
 def done_task(args):
     """Complete a task by canonical ID only."""
+    from task_transitions import block_unsafe_query, complete_by_id, print_result
+
     query = args.query.strip()
-    if not re.fullmatch(r"[A-Za-z0-9._:-]+", query):
+    if not TASK_ID_QUERY_RE.fullmatch(query):
         print_result(block_unsafe_query(args.query))
         sys.exit(2)
 
@@ -787,6 +794,8 @@ def done_task(args):
 
 def revert_task(args):
     """Revert a completion by completion_id only."""
+    from task_transitions import print_result, revert_completion
+
     completion_id = args.completion_id.strip()
     if not COMPLETION_ID_RE.fullmatch(completion_id):
         print_result(
@@ -821,6 +830,7 @@ def revert_task(args):
 def capture_task(args):
     """Capture a chat-stated completion through the two-lane U3 pipeline."""
     from chat_capture import capture_text
+    from task_transitions import print_result
 
     if args.personal:
         print_result(
@@ -854,8 +864,10 @@ def capture_task(args):
 
 def remove_task(args):
     """Cancel/remove a task by canonical ID only."""
+    from task_transitions import block_unsafe_query, cancel_by_id, print_result
+
     query = args.query.strip()
-    if not re.fullmatch(r"[A-Za-z0-9._:-]+", query):
+    if not TASK_ID_QUERY_RE.fullmatch(query):
         print_result(block_unsafe_query(args.query))
         sys.exit(2)
 
@@ -867,6 +879,9 @@ def remove_task(args):
 
 def cmd_rollover(args):
     """Regenerate the weekly board as one canonical open-task list."""
+    from rollover import run_rollover
+    from task_transitions import print_result
+
     tasks_file, _ = get_tasks_file(args.personal)
     result = run_rollover(
         personal=args.personal,
@@ -901,11 +916,47 @@ def show_blockers(args):
         print()
 
 
+_ARCHIVE_ENTRY_PREFIX = '- ✅ **'
+
+
+def _archive_entry_key(line: str) -> tuple[str, str] | None:
+    """Return the ``(title, completed_date)`` dedup key of an archive entry line.
+
+    Entries look like ``- ✅ **Title** [Area] ✅ YYYY-MM-DD``; the date part is
+    optional (``''`` when absent). Non-entry lines return None. Plain string
+    checks instead of regexes, since this runs on every line of the quarterly
+    archive.
+    """
+    if not line.startswith(_ARCHIVE_ENTRY_PREFIX):
+        return None
+    title_start = len(_ARCHIVE_ENTRY_PREFIX)
+    title_end = line.find('**', title_start + 1)
+    if title_end < 0:
+        return None
+    title_key = line[title_start:title_end].strip().casefold()
+
+    date_key = ''
+    tail = line.rstrip()
+    candidate = tail[-10:]
+    if (
+        len(candidate) == 10
+        and candidate[4] == '-'
+        and candidate[7] == '-'
+        and (candidate[:4] + candidate[5:7] + candidate[8:]).isdecimal()
+        and tail[:-10].rstrip().endswith('✅')
+    ):
+        date_key = candidate
+    return title_key, date_key
+
+
 def archive_done(args):
     """Archive completed tasks from daily notes into quarterly file.
 
     Also cleans any stale [x] lines still on the board (backward compat).
     """
+    from daily_notes import extract_completed_tasks
+    from task_lines import remove_task_lines
+
     notes_dir_raw = os.getenv("TASK_TRACKER_DAILY_NOTES_DIR")
     if not notes_dir_raw:
         print(
@@ -927,19 +978,24 @@ def archive_done(args):
     # Also collect any stale [x] items still on the board
     tasks_file, format = get_tasks_file(args.personal)
     stale_board: list[dict] = []
+    content = None
     if tasks_file.exists():
         content = tasks_file.read_text()
         tasks_data = parse_tasks(content, args.personal, format)
         stale_board = tasks_data.get('done', [])
 
     # Merge (deduplicate by title + date)
+    # Casefolded titles are kept parallel to all_done for the archive check.
     all_done: list[dict] = list(notes_tasks)
-    seen = {(t['title'].casefold(), t.get('completed_date', '')) for t in all_done}
+    done_titles = [t['title'].casefold() for t in all_done]
+    seen = {(title, t.get('completed_date', '')) for title, t in zip(done_titles, all_done)}
     for bt in stale_board:
-        key = (bt['title'].casefold(), bt.get('completed_date', ''))
+        title = bt['title'].casefold()
+        key = (title, bt.get('completed_date', ''))
         if key not in seen:
             seen.add(key)
             all_done.append(bt)
+            done_titles.append(title)
 
     if not all_done:
         print("No completed tasks to archive.")
@@ -950,26 +1006,23 @@ def archive_done(args):
     ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
     archive_file = ARCHIVE_DIR / f"ARCHIVE-{quarter}.md"
 
-    if archive_file.exists():
-        archive_content = archive_file.read_text()
-    else:
-        archive_content = f"# Task Archive - {quarter}\n"
-
     # Build set of (title, completed_date) already archived to prevent
     # duplicate entries across repeated runs while preserving recurring
-    # tasks completed on different dates.
+    # tasks completed on different dates. The archive is streamed, not held.
     already_archived: set[tuple[str, str]] = set()
-    for line in archive_content.splitlines():
-        m = re.match(r'^- ✅ \*\*(.+?)\*\*', line)
-        if m:
-            title_key = m.group(1).strip().casefold()
-            date_m = re.search(r'✅\s*(\d{4}-\d{2}-\d{2})\s*$', line)
-            date_key = date_m.group(1) if date_m else ''
-            already_archived.add((title_key, date_key))
+    if archive_file.exists():
+        archive_header = ''
+        with archive_file.open() as archive_fh:
+            for line in archive_fh:
+                key = _archive_entry_key(line)
+                if key is not None:
+                    already_archived.add(key)
+    else:
+        archive_header = f"# Task Archive - {quarter}\n"
 
     new_tasks = [
-        t for t in all_done
-        if (t['title'].casefold(), t.get('completed_date') or '') not in already_archived
+        t for title, t in zip(done_titles, all_done)
+        if (title, t.get('completed_date') or '') not in already_archived
     ]
     if not new_tasks:
         print("All completed tasks are already archived.")
@@ -982,27 +1035,48 @@ def archive_done(args):
         area_suffix = f" [{task.get('area')}]" if task.get('area') else ""
         archive_entry += f"- ✅ **{task['title']}**{area_suffix}{date_suffix}\n"
 
-    archive_content += archive_entry
-    archive_file.write_text(archive_content)
+    # Append-only: existing archive content is never rewritten.
+    with archive_file.open('a') as archive_fh:
+        archive_fh.write(archive_header + archive_entry)
 
-    # Clean stale [x] lines from the board
+    # Clean stale [x] lines from the board. Their line numbers were recorded
+    # against ``content`` above, so the board is not re-read.
     removed = 0
-    if stale_board and tasks_file.exists():
-        board_content = tasks_file.read_text()
-        for task in sorted(stale_board, key=lambda t: t.get('line_number') or 0, reverse=True):
-            raw_line = task.get('raw_line', '')
-            line_number = task.get('line_number')
-            updated = remove_task_line(board_content, raw_line, line_number)
-            if updated is not None:
-                board_content = updated
-                removed += 1
-        tasks_file.write_text(board_content)
+    if stale_board and content is not None:
+        board_content, removed = remove_task_lines(
+            content,
+            ((task.get('raw_line', ''), task.get('line_number')) for task in stale_board),
+        )
+        if removed:
+            tasks_file.write_text(board_content)
 
     total = len(new_tasks)
     extra = f" (cleaned {removed} stale lines from board)" if removed else ""
     print(f"✅ Archived {total} {task_type} tasks to {archive_file.name}{extra}")
 
 
+def _insert_before_first_task(content: str, task_line: str) -> str:
+    """Insert ``task_line`` above the board's first ``- [`` line.
+
+    Without any task line it goes after the last ``## `` header, or at the top
+    of an empty/header-less board. Works on string offsets, so the board is
+    not split into lines for a one-line insert.
+    """
+    if content.startswith('- ['):
+        pos = 0
+    else:
+        pos = content.find('\n- [') + 1
+        if pos == 0:
+            header = content.rfind('\n## ') + 1
+            if header == 0 and not content.startswith('## '):
+                return f"{task_line}\n{content}"
+            line_end = content.find('\n', header)
+            if line_end < 0:
+                return f"{content}\n{task_line}"
+            pos = line_end + 1
+    return f"{content[:pos]}{task_line}\n{content[pos:]}"
+
+
 def cmd_delegated(args):
     """Dispatch delegated subcommands."""
     import delegation
@@ -1050,17 +1124,7 @@ def cmd_delegated(args):
             dept_tag = f" #{item.get('department')}" if item.get('department') else ''
             task_id = f"tsk_{uuid.uuid4().hex[:16]}"
             task_line = f"- [ ] **{item['title']}** task_id::{task_id}{dept_tag}"
-            # Insert at beginning of first section
-            lines = content.split('\n')
-            insert_at = 0
-            for i, line in enumerate(lines):
-                if re.match(r'^- \[', line):
-                    insert_at = i
-                    break
-                if line.startswith('## '):
-                    insert_at = i + 1
-            lines.insert(insert_at, task_line)
-            tasks_file.write_text('\n'.join(lines))
+            tasks_file.write_text(_insert_before_first_task(content, task_line))
             delegation.take_back_item(path, args.id)
             print(f"✅ Took back: {item['title']} (added to {tasks_file.name})")
         except ValueError as e:
@@ -1092,10 +1156,14 @@ def cmd_parking_lot(args):
 
 
 def cmd_identity_audit(args):
+    from task_identity import audit_payload, print_json as print_identity_json
+
     print_identity_json(audit_payload(personal=args.personal))
 
 
 def cmd_task_audit(args):
+    from task_audit import collect_task_audit
+
     payload = _new_schema("task-audit")
     payload.update(
         collect_task_audit(
@@ -1106,10 +1174,12 @@ def cmd_task_audit(args):
             limit=args.limit,
         )
     )
-    print(json.dumps(payload, indent=2))
+    print(dump_json(payload))
 
 
 def cmd_identity_repair(args):
+    from task_repair import repair_missing_ids
+
     payload = repair_missing_ids(personal=args.personal, apply=args.apply)
     print(json.dumps(payload, indent=2, sort_keys=True))
     if payload.get("blocked"):
@@ -1117,16 +1187,10 @@ def cmd_identity_repair(args):
 
 
 def cmd_promote_from_backlog(args):
-    from parking_lot import promote_item
+    from parking_lot import promote_items
     tasks_file, _ = get_tasks_file(args.personal)
     cap = max(int(args.cap or 1), 1)
-    promoted = []
-    for _ in range(cap):
-        out = promote_item(tasks_file, 1)
-        if out.startswith('✅'):
-            promoted.append(out)
-        else:
-            break
+    promoted = promote_items(tasks_file, cap)
     if not promoted:
         print("No backlog items promoted.")
     else:
@@ -1136,8 +1200,9 @@ def cmd_promote_from_backlog(args):
 
 def cmd_review_backlog(args):
     from parking_lot import list_stale
+    stale_days = args.stale_days if args.stale_days is not None else _env_int('PARKING_LOT_STALE_DAYS', 30)
     old = os.getenv('PARKING_LOT_STALE_DAYS')
-    os.environ['PARKING_LOT_STALE_DAYS'] = str(args.stale_days)
+    os.environ['PARKING_LOT_STALE_DAYS'] = str(stale_days)
     try:
         raw = list_stale(get_tasks_file(args.personal)[0])
     finally:
@@ -1150,27 +1215,37 @@ def cmd_review_backlog(args):
         return
     items = json.loads(raw)
     if not items:
-        print(f"No stale backlog items (threshold: {args.stale_days}d).")
+        print(f"No stale backlog items (threshold: {stale_days}d).")
         return
     print(f"Stale backlog items ({len(items)}):")
     for it in items:
         print(f"- #{it['id']} {it['title']} ({it['age_days']}d)")
 
 
-def _calendar_classification(task: dict) -> str:
-    raw = str(task.get('raw_line') or '').lower()
-    title = str(task.get('title') or '').lower()
-    if 'status::blocked' in raw or 'depends::' in raw:
+def _meeting_statuses(raw_l: str) -> list[str]:
+    """Return the ``status::`` values on a lowercased meeting line, in order."""
+    pos = raw_l.find('status::')
+    if pos < 0:
+        return []
+    return MEETING_STATUS_RE.findall(raw_l, pos)
+
+
+def _calendar_classification(raw_l: str, title: str) -> str:
+    """Classify a meeting from its lowercased raw line and its title."""
+    title = (title or '').lower()
+    if 'status::blocked' in raw_l or 'depends::' in raw_l:
         return 'blocked'
-    if '#private' in raw or 'private::true' in raw:
+    if '#private' in raw_l or 'private::true' in raw_l:
         return 'private'
-    if 'buffer' in title or 'buffer::true' in raw:
+    if 'buffer' in title or 'buffer::true' in raw_l:
         return 'buffer'
     return 'normal'
 
 
 def cmd_calendar_sync(args):
     """Calendar sync payload for orchestration consumers."""
+    from standup_common import flatten_calendar_events, get_calendar_events
+
     _, tasks_data = load_tasks(args.personal)
     events = flatten_calendar_events(get_calendar_events())
     meetings = []
@@ -1178,12 +1253,13 @@ def cmd_calendar_sync(args):
         raw = str(task.get('raw_line') or '')
         if 'meeting::' not in raw:
             continue
-        status_match = re.search(r'status::(scheduled|done|canceled|blocked)', raw, flags=re.IGNORECASE)
-        status = status_match.group(1).lower() if status_match else ('done' if task.get('done') else 'scheduled')
+        raw_l = raw.lower()
+        statuses = _meeting_statuses(raw_l)
+        status = statuses[0] if statuses else ('done' if task.get('done') else 'scheduled')
         meetings.append({
             'title': task.get('title', ''),
             'status': status,
-            'classification': _calendar_classification(task),
+            'classification': _calendar_classification(raw_l, task.get('title')),
             'done': bool(task.get('done')),
         })
 
@@ -1194,13 +1270,15 @@ def cmd_calendar_sync(args):
         'meetings': meetings,
     }
     if args.json:
-        print(json.dumps(payload, indent=2))
+        print(dump_json(payload))
     else:
         print(f"Synced {len(meetings)} meeting task(s); events seen: {len(events)}")
 
 
 def cmd_calendar_resolve(args):
     """Resolve calendar lifecycle from note completions in a date window."""
+    from daily_notes import extract_completed_tasks
+
     _, tasks_data = load_tasks(args.personal)
     today = datetime.now().date()
     if args.window == 'today':
@@ -1210,7 +1288,7 @@ def cmd_calendar_resolve(args):
 
     notes_dir_raw = os.getenv("TASK_TRACKER_DAILY_NOTES_DIR")
     completed = extract_completed_tasks(Path(notes_dir_raw), start, end) if notes_dir_raw else []
-    done_titles = {t.get('title', '').casefold() for t in completed}
+    done_titles = frozenset(t.get('title', '').casefold() for t in completed)
 
     resolved = []
     for task in tasks_data.get('all', []):
@@ -1218,13 +1296,13 @@ def cmd_calendar_resolve(args):
         if 'meeting::' not in raw:
             continue
         title = task.get('title', '')
-        raw_l = raw.lower()
+        statuses = _meeting_statuses(raw.lower())
         status = 'done' if title.casefold() in done_titles else 'scheduled'
-        if 'status::blocked' in raw_l:
+        if 'blocked' in statuses:
             status = 'blocked'
-        if 'status::done' in raw_l or task.get('done'):
+        if 'done' in statuses or task.get('done'):
             status = 'done'
-        if 'status::canceled' in raw_l:
+        if 'canceled' in statuses:
             status = 'canceled'
         resolved.append({'title': title, 'status': status, 'window': args.window})
 
@@ -1235,31 +1313,34 @@ def cmd_calendar_resolve(args):
         'idempotent': True,
     }
     if args.json:
-        print(json.dumps(payload, indent=2))
+        print(dump_json(payload))
     else:
         print(f"Resolved {len(resolved)} meeting lifecycle item(s) for {args.window}")
 
 
 def cmd_done_scan(args):
     """Scan completed items in a true rolling time window for standup consumers."""
+    from daily_notes import iter_completed_tasks
+
     window_map = {'24h': timedelta(hours=24), '7d': timedelta(days=7), '30d': timedelta(days=30)}
-    cutoff = datetime.now() - window_map[args.window]
-    end = datetime.now().date()
+    now = datetime.now()
+    cutoff = now - window_map[args.window]
+    end = now.date()
     start = (cutoff.date() - timedelta(days=1))
 
     notes_dir_raw = os.getenv("TASK_TRACKER_DAILY_NOTES_DIR")
     items = []
     if notes_dir_raw:
-        raw_items = extract_completed_tasks(Path(notes_dir_raw), start, end)
-        for item in raw_items:
+        for item in iter_completed_tasks(Path(notes_dir_raw), start, end):
             try:
-                item_date = datetime.strptime(item.get('completed_date', ''), '%Y-%m-%d').date()
+                item_date = date.fromisoformat(item.get('completed_date', ''))
             except ValueError:
                 continue
             ts = item.get('timestamp')
             if ts:
+                hour, _, minute = ts.partition(':')
                 try:
-                    item_dt = datetime.strptime(f"{item_date.isoformat()} {ts}", '%Y-%m-%d %H:%M')
+                    item_dt = datetime(item_date.year, item_date.month, item_date.day, int(hour), int(minute))
                 except ValueError:
                     item_dt = datetime.combine(item_date, datetime.max.time())
             else:
@@ -1274,7 +1355,7 @@ def cmd_done_scan(args):
         'items': items,
     }
     if args.json:
-        print(json.dumps(payload, indent=2))
+        print(dump_json(payload))
     else:
         print(f"Done items ({args.window}): {len(items)}")
 
@@ -1314,31 +1395,58 @@ def _safe_load_tasks(personal: bool = False) -> dict:
         return empty
 
 
+# Board section -> display label used when grouping summaries by category.
+_CATEGORY_LABELS = {
+    "q1": "Q1",
+    "q2": "Q2",
+    "q3": "Q3",
+    "team": "Team",
+    "backlog": "Backlog",
+    "today": "Today",
+    "objectives": "Objectives",
+    "parking_lot": "Parking Lot",
+}
+
+
 def _group_tasks_by_area(tasks: list[dict]) -> dict[str, list[dict]]:
     grouped: dict[str, list[dict]] = {}
     for task in tasks:
         key = task.get("area") or "Uncategorized"
         grouped.setdefault(key, []).append(task)
-    return dict(sorted(grouped.items(), key=lambda item: item[0].casefold()))
+    return {key: grouped[key] for key in sorted(grouped, key=str.casefold)}
 
 
 def _group_tasks_by_category(tasks: list[dict]) -> dict[str, list[dict]]:
-    labels = {
-        "q1": "Q1",
-        "q2": "Q2",
-        "q3": "Q3",
-        "team": "Team",
-        "backlog": "Backlog",
-        "today": "Today",
-        "objectives": "Objectives",
-        "parking_lot": "Parking Lot",
-    }
     grouped: dict[str, list[dict]] = {}
     for task in tasks:
         section = task.get("section")
-        key = labels.get(section, section or "Uncategorized")
+        key = _CATEGORY_LABELS.get(section, section or "Uncategorized")
         grouped.setdefault(key, []).append(task)
-    return dict(sorted(grouped.items(), key=lambda item: item[0].casefold()))
+    return {key: grouped[key] for key in sorted(grouped, key=str.casefold)}
+
+
+def _legacy_task_area(task: dict) -> str:
+    return task.get("area") or task.get("department") or "Uncategorized"
+
+
+def _legacy_task_row(task: dict) -> dict:
+    """Summary row for a legacy-parser task with no matching TaskRecord."""
+    task_id = task.get("task_id")
+    canonical_id = task_id or task.get("legacy_id")
+    return {
+        "task_id": canonical_id,
+        "fallback_id": None,
+        "missing_task_id": task_id is None,
+        "fallback_only": not canonical_id,
+        "title": task.get("title", ""),
+        "done": bool(task.get("done")),
+        "section": task.get("section"),
+        "area": _legacy_task_area(task),
+        "priority": task.get("priority"),
+        "due": task.get("due"),
+        "owner": task.get("owner"),
+        "goal": task.get("goal"),
+    }
 
 
 def _parse_range_inputs(week: str | None, start_raw: str | None, end_raw: str | None) -> tuple[date, date, str]:
@@ -1359,7 +1467,7 @@ def _parse_range_inputs(week: str | None, start_raw: str | None, end_raw: str |
         start_date = today - timedelta(days=today.weekday())
         return start_date, start_date + timedelta(days=6), "current-week"
 
-    match = re.fullmatch(r"(\d{4})-W(\d{2})", week)
+    match = ISO_WEEK_RE.fullmatch(week)
     if not match:
         raise ValueError("Invalid --week format. Use YYYY-WNN (example: 2026-W07).")
     start_date = date.fromisocalendar(int(match.group(1)), int(match.group(2)), 1)
@@ -1367,7 +1475,12 @@ def _parse_range_inputs(week: str | None, start_raw: str | None, end_raw: str |
 
 
 def cmd_standup_summary(args):
-    tasks_data = _safe_load_tasks(args.personal)
+    from candidate_review import candidate_review_summary
+    from daily_notes import extract_completed_tasks
+    from evidence_matching import canonical_record as _canonical_record, safe_load_task_records as _safe_load_task_records
+    from task_audit import task_audit_summary
+    from task_records import active_records
+
     records = _safe_load_task_records(args.personal)
     today = datetime.now().date()
 
@@ -1385,19 +1498,37 @@ def cmd_standup_summary(args):
             for item in notes_items
         ]
     else:
+        # The legacy parser is only needed for board-side completions.
+        tasks_data = _safe_load_tasks(args.personal)
         dones = [
             {
                 "title": task.get("title", ""),
                 "completed_date": task.get("completed_date"),
                 "timestamp": None,
-                "area": task.get("area") or task.get("department") or "Uncategorized",
+                "area": _legacy_task_area(task),
             }
             for task in tasks_data.get("done", [])
         ]
 
-    active = active_records(records)
-    dos_records = [record for record in active if record.section in {"q1", "q2", "today"}]
-    dos = [_canonical_record(record) for record in dos_records]
+    # One pass over the active records fills both lists; an overdue Q1/Q2/today
+    # task shares its canonical row between them.
+    dos: list[dict] = []
+    overdue: list[dict] = []
+    overdue_records = []
+    for record in active_records(records):
+        row = None
+        if record.section in _STANDUP_DO_SECTIONS:
+            row = _canonical_record(record)
+            dos.append(row)
+        if not record.due:
+            continue
+        try:
+            due_date = parse_due_date(record.due)
+        except ValueError:
+            continue
+        if due_date < today:
+            overdue_records.append(record)
+            overdue.append(row if row is not None else _canonical_record(record))
 
     # Layer-2 capacity ceiling (U3): surface the active-inventory load against
     # ~1 week of capacity so the /standup consumer can show the cap state. The
@@ -1420,18 +1551,6 @@ def cmd_standup_summary(args):
         except Exception:
             capacity = None
 
-    overdue_records = []
-    for record in active:
-        if not record.due:
-            continue
-        try:
-            due_date = datetime.strptime(record.due, "%Y-%m-%d").date()
-        except ValueError:
-            continue
-        if due_date < today:
-            overdue_records.append(record)
-    overdue = [_canonical_record(record) for record in overdue_records]
-
     carryover_suggestions = []
     for record in overdue_records:
         carryover_suggestions.append(
@@ -1468,19 +1587,26 @@ def cmd_standup_summary(args):
             },
         }
     )
-    print(json.dumps(payload, indent=2))
+    print(dump_json(payload))
 
 
 def cmd_weekly_review_summary(args):
+    from candidate_review import candidate_review_summary
+    from daily_notes import extract_completed_tasks
+    from evidence_matching import canonical_record as _canonical_record, safe_load_task_records as _safe_load_task_records
+    from task_audit import task_audit_summary
+    from task_records import active_records
+
     try:
         start_date, end_date, selection_mode = _parse_range_inputs(args.week, args.start, args.end)
     except ValueError as exc:
         print(f"❌ {exc}", file=sys.stderr)
         sys.exit(2)
 
-    tasks_data = _safe_load_tasks(args.personal)
     records = _safe_load_task_records(args.personal)
     notes_dir_raw = os.getenv("TASK_TRACKER_DAILY_NOTES_DIR")
+    # The legacy parser only feeds board-side completions and the no-records fallback.
+    tasks_data = _safe_load_tasks(args.personal) if not notes_dir_raw or not records else {}
 
     done_items: list[dict] = []
     if notes_dir_raw:
@@ -1501,34 +1627,20 @@ def cmd_weekly_review_summary(args):
             for item in note_tasks
         ]
     else:
+        records_by_line: dict[tuple, object] = {}
+        for record in records:
+            records_by_line.setdefault((record.line_number, record.raw_line), record)
         for task in tasks_data.get("done", []):
             completed = task.get("completed_date")
             if not completed:
                 continue
             try:
-                completed_date = datetime.strptime(completed, "%Y-%m-%d").date()
+                completed_date = date.fromisoformat(completed)
             except ValueError:
                 continue
             if start_date <= completed_date <= end_date:
-                matching = [
-                    record for record in records
-                    if record.line_number == task.get("line_number")
-                    and record.raw_line == task.get("raw_line")
-                ]
-                row = _canonical_record(matching[0]) if matching else {
-                    "task_id": task.get("task_id") or task.get("legacy_id"),
-                    "fallback_id": None,
-                    "missing_task_id": task.get("task_id") is None,
-                    "fallback_only": not (task.get("task_id") or task.get("legacy_id")),
-                    "title": task.get("title", ""),
-                    "done": bool(task.get("done")),
-                    "section": task.get("section"),
-                    "area": task.get("area") or task.get("department") or "Uncategorized",
-                    "priority": task.get("priority"),
-                    "due": task.get("due"),
-                    "owner": task.get("owner"),
-                    "goal": task.get("goal"),
-                }
+                matching = records_by_line.get((task.get("line_number"), task.get("raw_line")))
+                row = _canonical_record(matching) if matching is not None else _legacy_task_row(task)
                 row["completed_date"] = completed
                 done_items.append(row)
 
@@ -1537,7 +1649,7 @@ def cmd_weekly_review_summary(args):
         due_raw = record.due
         if due_raw:
             try:
-                due_date = datetime.strptime(due_raw, "%Y-%m-%d").date()
+                due_date = parse_due_date(due_raw)
             except ValueError:
                 continue
             if due_date < start_date or due_date > end_date:
@@ -1551,27 +1663,12 @@ def cmd_weekly_review_summary(args):
             due_raw = task.get("due")
             if due_raw:
                 try:
-                    due_date = datetime.strptime(due_raw, "%Y-%m-%d").date()
+                    due_date = parse_due_date(due_raw)
                 except ValueError:
                     continue
                 if due_date < start_date or due_date > end_date:
                     continue
-            do_items.append(
-                {
-                    "task_id": task.get("task_id") or task.get("legacy_id"),
-                    "fallback_id": None,
-                    "missing_task_id": task.get("task_id") is None,
-                    "fallback_only": not (task.get("task_id") or task.get("legacy_id")),
-                    "title": task.get("title", ""),
-                    "done": False,
-                    "section": task.get("section"),
-                    "area": task.get("area") or task.get("department") or "Uncategorized",
-                    "priority": task.get("priority"),
-                    "due": task.get("due"),
-                    "owner": task.get("owner"),
-                    "goal": task.get("goal"),
-                }
-            )
+            do_items.append(_legacy_task_row(task))
 
     payload = _new_schema("weekly-review-summary")
     payload.update(
@@ -1596,14 +1693,18 @@ def cmd_weekly_review_summary(args):
             "task_audit": task_audit_summary(personal=args.personal),
         }
     )
-    print(json.dumps(payload, indent=2))
+    print(dump_json(payload))
 
 
 def cmd_ingest_daily_log(args):
+    from evidence_matching import build_task_catalog, extract_done_lines_from, match_evidence_lines, safe_load_task_records as _safe_load_task_records
+
+    # Split once and keep only the lines: the totals count and the done-line
+    # parser both walk this list, and the full source string is not retained.
     if args.file:
         file_path = Path(args.file)
         try:
-            source_content = file_path.read_text(encoding="utf-8")
+            source_lines = file_path.read_text(encoding="utf-8").splitlines()
         except OSError as exc:
             payload = _new_schema("ingest-daily-log")
             payload.update(
@@ -1615,14 +1716,14 @@ def cmd_ingest_daily_log(args):
                     },
                 }
             )
-            print(json.dumps(payload, indent=2))
+            print(dump_json(payload))
             sys.exit(2)
         source = {"type": "file", "path": str(file_path)}
     else:
-        source_content = sys.stdin.read()
+        source_lines = sys.stdin.read().splitlines()
         source = {"type": "stdin"}
 
-    parsed_lines = extract_done_lines(source_content)
+    parsed_lines = extract_done_lines_from(source_lines)
     records = _safe_load_task_records(args.personal)
     catalog = build_task_catalog(records)
     auto_threshold = float(args.auto_threshold)
@@ -1631,10 +1732,9 @@ def cmd_ingest_daily_log(args):
         print("❌ --review-threshold cannot be greater than --auto-threshold", file=sys.stderr)
         sys.exit(2)
 
-    matched = [
-        match_evidence_line(line, catalog, auto_threshold=auto_threshold, review_threshold=review_threshold)
-        for line in parsed_lines
-    ]
+    matched = match_evidence_lines(
+        parsed_lines, catalog, auto_threshold=auto_threshold, review_threshold=review_threshold
+    )
 
     counts = {"evidence-link": 0, "needs-review": 0, "no-match": 0}
     for item in matched:
@@ -1649,7 +1749,7 @@ def cmd_ingest_daily_log(args):
                 "needs_review": review_threshold,
             },
             "totals": {
-                "input_lines": len(source_content.splitlines()),
+                "input_lines": len(source_lines),
                 "parsed_done_lines": len(parsed_lines),
                 "evidence_linked": counts["evidence-link"],
                 "needs_review": counts["needs-review"],
@@ -1658,7 +1758,7 @@ def cmd_ingest_daily_log(args):
             "items": matched,
         }
     )
-    print(json.dumps(payload, indent=2))
+    print(dump_json(payload))
 
 
 def _candidate_payload(command: str, **fields) -> dict:
@@ -1846,6 +1946,9 @@ def cmd_completion_candidates(args):
 
 
 def cmd_calendar_sync_primitive(args):
+    from evidence_matching import safe_load_task_records as _safe_load_task_records
+    from standup_common import flatten_calendar_events, get_calendar_events
+
     payload = _new_schema("calendar-sync")
     warnings: list[str] = []
     events = []
@@ -1863,12 +1966,13 @@ def cmd_calendar_sync_primitive(args):
             if "meeting::" not in raw:
                 continue
             raw_l = raw.lower()
+            statuses = _meeting_statuses(raw_l)
             status = "scheduled"
-            if record.done or "status::done" in raw_l:
+            if record.done or "done" in statuses:
                 status = "done"
-            elif "status::canceled" in raw_l:
+            elif "canceled" in statuses:
                 status = "canceled"
-            elif "status::blocked" in raw_l:
+            elif "blocked" in statuses:
                 status = "blocked"
 
             meetings.append(
@@ -1879,18 +1983,15 @@ def cmd_calendar_sync_primitive(args):
                     "fallback_only": record.fallback_only,
                     "title": record.title,
                     "status": status,
-                    "classification": _calendar_classification(record_to_task_dict(record)),
+                    "classification": _calendar_classification(raw_l, record.title),
                 }
             )
     except Exception:
         warnings.append("task-meetings-unavailable")
 
-    lifecycle_map = {
-        "scheduled": [m for m in meetings if m["status"] == "scheduled"],
-        "done": [m for m in meetings if m["status"] == "done"],
-        "blocked": [m for m in meetings if m["status"] == "blocked"],
-        "canceled": [m for m in meetings if m["status"] == "canceled"],
-    }
+    lifecycle_map: dict[str, list[dict]] = {status: [] for status in _MEETING_LIFECYCLE_STATUSES}
+    for meeting in meetings:
+        lifecycle_map[meeting["status"]].append(meeting)
 
     payload.update(
         {
@@ -1902,7 +2003,7 @@ def cmd_calendar_sync_primitive(args):
             "lifecycle_map": lifecycle_map,
         }
     )
-    print(json.dumps(payload, indent=2))
+    print(dump_json(payload))
 
 
 def _daily_note_link(which: str) -> dict:
@@ -1927,7 +2028,7 @@ def cmd_daily_links(args):
         'links': {args.window: _daily_note_link(args.window)},
     }
     if args.json:
-        print(json.dumps(payload, indent=2))
+        print(dump_json(payload))
     else:
         print(payload['links'][args.window]['deep'])
 
@@ -1955,7 +2056,7 @@ def cmd_objectives(args):
         ]
 
     if args.json:
-        print(json.dumps(objectives, indent=2))
+        print(dump_json(objectives))
         return
 
     if not objectives:
@@ -1976,24 +2077,22 @@ def cmd_objectives(args):
         print()
 
 
-def main():
-    parser = argparse.ArgumentParser(description='Task Tracker CLI (Work & Personal)')
-    parser.add_argument('--personal', action='store_true', help='Use Personal Tasks instead of Work Tasks')
-    
-    subparsers = parser.add_subparsers(dest='command', required=True)
-    
-    # List command
-    list_parser = subparsers.add_parser('list', help='List tasks')
-    list_parser.add_argument('--priority', choices=['high', 'medium', 'low'])
-    list_parser.add_argument('--status', choices=['open', 'done'])
-    list_parser.add_argument('--due', choices=['today', 'this-week', 'overdue', 'due-or-overdue'])
-    list_parser.add_argument('--completed-since', choices=['24h', '7d', '30d'])
-    list_parser.set_defaults(func=list_tasks)
-    
-    # Add command
-    add_parser = subparsers.add_parser('add', help='Add a task')
+def _configure_list_parser(list_parser):
+    list_parser.add_argument('--priority', choices=_PRIORITY_CHOICES)
+    list_parser.add_argument('--status', choices=('open', 'done'))
+    list_parser.add_argument('--due', choices=('today', 'this-week', 'overdue', 'due-or-overdue'))
+    list_parser.add_argument('--completed-since', choices=_COMPLETED_WINDOW_CHOICES)
+    list_parser.add_argument(
+        '--no-notes',
+        action='store_true',
+        help='With --completed-since, list board completions only (skip daily notes)',
+    )
+    list_parser.set_defaults(func='list_tasks')
+
+
+def _configure_add_parser(add_parser):
     add_parser.add_argument('title', help='Task title')
-    add_parser.add_argument('--priority', default='medium', choices=['high', 'medium', 'low'])
+    add_parser.add_argument('--priority', default='medium', choices=_PRIORITY_CHOICES)
     add_parser.add_argument('--due', help='Due date (YYYY-MM-DD)')
     add_parser.add_argument('--owner', default='me')
     add_parser.add_argument('--area', help='Area/category')
@@ -2002,41 +2101,31 @@ def main():
         action='store_true',
         help='Deprecated alias: over-cap adds already route to the parking lot by default (H6)',
     )
-    add_parser.set_defaults(func=add_task)
+    add_parser.set_defaults(func='add_task')
 
-    # Promote command (H6): move a parked task onto the active board, capacity-gated.
-    promote_parser = subparsers.add_parser(
-        'promote',
-        help='Promote a parked task onto the active board (capacity-gated)',
-    )
+
+def _configure_promote_parser(promote_parser):
     promote_parser.add_argument('id', type=int, help='Parking-lot item id (from parking-lot list)')
-    promote_parser.set_defaults(func=promote_task)
+    promote_parser.set_defaults(func='promote_task')
 
-    # Swap command (H6): park an active task and promote a parked one in its place.
-    swap_parser = subparsers.add_parser(
-        'swap',
-        help='Park an active task and promote a parked task into the freed slot',
-    )
+
+def _configure_swap_parser(swap_parser):
     swap_parser.add_argument('out_id', help='Canonical task_id of the active task to park out')
     swap_parser.add_argument('in_id', type=int, help='Parking-lot item id to promote in')
-    swap_parser.set_defaults(func=swap_tasks)
+    swap_parser.set_defaults(func='swap_tasks')
+
 
-    # Done command
-    done_parser = subparsers.add_parser('done', help='Mark task as done by canonical task_id')
+def _configure_done_parser(done_parser):
     done_parser.add_argument('query', help='Canonical task_id')
-    done_parser.set_defaults(func=done_task)
+    done_parser.set_defaults(func='done_task')
+
 
-    revert_parser = subparsers.add_parser('revert', help='Revert a completion by completion_id')
+def _configure_revert_parser(revert_parser):
     revert_parser.add_argument('completion_id', help='Completion id returned by done/auto-complete')
-    revert_parser.set_defaults(func=revert_task)
-
-    capture_parser = subparsers.add_parser(
-        'capture',
-        help=(
-            'Capture a chat-stated completion on the work board. Raw text is '
-            'candidate-only; auto-write requires a verified gateway envelope.'
-        ),
-    )
+    revert_parser.set_defaults(func='revert_task')
+
+
+def _configure_capture_parser(capture_parser):
     capture_input = capture_parser.add_mutually_exclusive_group(required=True)
     capture_input.add_argument('--text', help='Raw chat statement to stage as a candidate or miss')
     capture_input.add_argument('--envelope', help='Signed gateway envelope JSON for verified auto-complete')
@@ -2047,25 +2136,25 @@ def main():
     capture_parser.add_argument('--channel', help='Channel recorded for candidate/miss provenance')
     capture_parser.add_argument('--message-id', help='Message id recorded for candidate/miss provenance')
     capture_parser.add_argument('--source', default='chat', help='Source label stored on the candidate/miss')
-    capture_parser.set_defaults(func=capture_task)
+    capture_parser.set_defaults(func='capture_task')
 
-    # Remove/cancel command
-    remove_parser = subparsers.add_parser(
-        'remove',
-        help='Cancel/remove a task from the board by canonical task_id',
-    )
+
+def _configure_remove_parser(remove_parser):
     remove_parser.add_argument('query', help='Canonical task_id')
-    remove_parser.set_defaults(func=remove_task)
+    remove_parser.set_defaults(func='remove_task')
 
-    rollover_parser = subparsers.add_parser('rollover', help='Regenerate the weekly board deterministically')
+
+def _configure_rollover_parser(rollover_parser):
     rollover_parser.add_argument('--date', help='Target date for ISO week header (YYYY-MM-DD)')
     rollover_parser.add_argument('--dry-run', action='store_true', help='Print result without writing the board')
-    rollover_parser.set_defaults(func=cmd_rollover)
+    rollover_parser.set_defaults(func='cmd_rollover')
+
+
+def _configure_identity_audit_parser(identity_audit_parser):
+    identity_audit_parser.set_defaults(func='cmd_identity_audit')
 
-    identity_audit_parser = subparsers.add_parser('identity-audit', help='Read-only canonical identity audit')
-    identity_audit_parser.set_defaults(func=cmd_identity_audit)
 
-    task_audit_parser = subparsers.add_parser('task-audit', help='Read-only task health audit')
+def _configure_task_audit_parser(task_audit_parser):
     task_audit_parser.add_argument(
         '--stale-days',
         type=int,
@@ -2089,41 +2178,40 @@ def main():
         default=5,
         help='Maximum findings included in the summary block',
     )
-    task_audit_parser.set_defaults(func=cmd_task_audit)
+    task_audit_parser.set_defaults(func='cmd_task_audit')
 
-    identity_repair_parser = subparsers.add_parser('identity-repair', help='Repair missing task_id metadata')
+
+def _configure_identity_repair_parser(identity_repair_parser):
     identity_repair_parser.add_argument('--apply', action='store_true', help='Write safe task_id repairs')
-    identity_repair_parser.set_defaults(func=cmd_identity_repair)
+    identity_repair_parser.set_defaults(func='cmd_identity_repair')
+
 
-    done_scan_parser = subparsers.add_parser('done-scan', help='Scan completed items from daily notes')
-    done_scan_parser.add_argument('--window', choices=['24h', '7d', '30d'], default='24h')
+def _configure_done_scan_parser(done_scan_parser):
+    done_scan_parser.add_argument('--window', choices=_COMPLETED_WINDOW_CHOICES, default='24h')
     done_scan_parser.add_argument('--json', action='store_true')
-    done_scan_parser.set_defaults(func=cmd_done_scan)
+    done_scan_parser.set_defaults(func='cmd_done_scan')
+
 
-    daily_links_parser = subparsers.add_parser('daily-links', help='Generate daily note links')
-    daily_links_parser.add_argument('--window', choices=['today', 'yesterday'], default='today')
+def _configure_daily_links_parser(daily_links_parser):
+    daily_links_parser.add_argument('--window', choices=_DAY_WINDOW_CHOICES, default='today')
     daily_links_parser.add_argument('--json', action='store_true')
-    daily_links_parser.set_defaults(func=cmd_daily_links)
+    daily_links_parser.set_defaults(func='cmd_daily_links')
 
-    standup_summary_parser = subparsers.add_parser(
-        'standup-summary',
-        help='Return standup primitive summary JSON',
-    )
-    standup_summary_parser.set_defaults(func=cmd_standup_summary)
 
-    weekly_review_summary_parser = subparsers.add_parser(
-        'weekly-review-summary',
-        help='Return weekly review primitive summary JSON',
-    )
+def _configure_standup_summary_parser(standup_summary_parser):
+    standup_summary_parser.set_defaults(func='cmd_standup_summary')
+
+
+def _configure_weekly_review_summary_parser(weekly_review_summary_parser):
     weekly_review_summary_parser.add_argument('--week', help='ISO week to review (YYYY-WNN)')
     weekly_review_summary_parser.add_argument('--start', help='Start date (YYYY-MM-DD)')
     weekly_review_summary_parser.add_argument('--end', help='End date (YYYY-MM-DD)')
-    weekly_review_summary_parser.set_defaults(func=cmd_weekly_review_summary)
+    weekly_review_summary_parser.set_defaults(func='cmd_weekly_review_summary')
+
+
+def _configure_ingest_daily_log_parser(ingest_daily_log_parser):
+    from evidence_matching import FUZZY_EVIDENCE_LINK_THRESHOLD, FUZZY_REVIEW_THRESHOLD
 
-    ingest_daily_log_parser = subparsers.add_parser(
-        'ingest-daily-log',
-        help='Report done-line evidence links for canonical tasks',
-    )
     ingest_daily_log_parser.add_argument('--file', help='Input log file; default is stdin')
     ingest_daily_log_parser.add_argument(
         '--auto-threshold',
@@ -2137,12 +2225,13 @@ def main():
         default=FUZZY_REVIEW_THRESHOLD,
         help='Fuzzy score threshold for needs-review',
     )
-    ingest_daily_log_parser.set_defaults(func=cmd_ingest_daily_log)
+    ingest_daily_log_parser.set_defaults(func='cmd_ingest_daily_log')
 
-    candidates_parser = subparsers.add_parser(
-        'completion-candidates',
-        help='Manage durable completion evidence candidates',
-    )
+
+def _configure_completion_candidates_parser(candidates_parser):
+    # Every candidate action shares one handler, which dispatches on
+    # ``candidate_command``; set it once on the group rather than per action.
+    candidates_parser.set_defaults(func='cmd_completion_candidates')
     candidates_sub = candidates_parser.add_subparsers(
         dest='candidate_command',
         required=True,
@@ -2158,7 +2247,6 @@ def main():
         '--notes-dir',
         help='Daily notes directory; defaults to TASK_TRACKER_DAILY_NOTES_DIR',
     )
-    candidates_scan.set_defaults(func=cmd_completion_candidates)
 
     candidates_list = candidates_sub.add_parser(
         'list',
@@ -2174,7 +2262,6 @@ def main():
         action='store_true',
         help='Record shown events for new listed candidates',
     )
-    candidates_list.set_defaults(func=cmd_completion_candidates)
 
     candidates_show = candidates_sub.add_parser(
         'show',
@@ -2186,7 +2273,6 @@ def main():
         action='store_true',
         help='Record a shown event for a new candidate',
     )
-    candidates_show.set_defaults(func=cmd_completion_candidates)
 
     candidates_confirm = candidates_sub.add_parser(
         'confirm',
@@ -2194,7 +2280,6 @@ def main():
     )
     candidates_confirm.add_argument('candidate_id', help='Candidate ID')
     candidates_confirm.add_argument('--task-id', help='Canonical task_id to complete')
-    candidates_confirm.set_defaults(func=cmd_completion_candidates)
 
     candidates_reject = candidates_sub.add_parser(
         'reject',
@@ -2202,7 +2287,6 @@ def main():
     )
     candidates_reject.add_argument('candidate_id', help='Candidate ID')
     candidates_reject.add_argument('--reason', help='Optional rejection reason')
-    candidates_reject.set_defaults(func=cmd_completion_candidates)
 
     candidates_duplicate = candidates_sub.add_parser(
         'duplicate',
@@ -2215,7 +2299,6 @@ def main():
         required=True,
         help='Canonical candidate ID',
     )
-    candidates_duplicate.set_defaults(func=cmd_completion_candidates)
 
     candidates_snooze = candidates_sub.add_parser(
         'snooze',
@@ -2223,106 +2306,256 @@ def main():
     )
     candidates_snooze.add_argument('candidate_id', help='Candidate ID')
     candidates_snooze.add_argument('--until', required=True, help='Snooze-until date (YYYY-MM-DD)')
-    candidates_snooze.set_defaults(func=cmd_completion_candidates)
 
-    calendar_sync_parser = subparsers.add_parser(
-        'calendar-sync',
-        help='Optional helper payload for calendar lifecycle mapping',
-    )
-    calendar_sync_parser.set_defaults(func=cmd_calendar_sync_primitive)
 
-    # Blockers command
-    blockers_parser = subparsers.add_parser('blockers', help='Show blocking tasks')
+def _configure_calendar_sync_parser(calendar_sync_parser):
+    calendar_sync_parser.set_defaults(func='cmd_calendar_sync_primitive')
+
+
+def _configure_blockers_parser(blockers_parser):
     blockers_parser.add_argument('--person', help='Filter by person being blocked')
-    blockers_parser.set_defaults(func=show_blockers)
-    
-    # Archive command
-    archive_parser = subparsers.add_parser('archive', help='Archive completed tasks')
-    archive_parser.set_defaults(func=archive_done)
+    blockers_parser.set_defaults(func='show_blockers')
 
-    calendar_parser = subparsers.add_parser('calendar', help='Calendar domain commands')
+
+def _configure_archive_parser(archive_parser):
+    archive_parser.set_defaults(func='archive_done')
+
+
+def _configure_calendar_parser(calendar_parser):
     calendar_sub = calendar_parser.add_subparsers(dest='calendar_command', required=True)
 
     cal_sync = calendar_sub.add_parser('sync', help='Sync calendar meeting classification/lifecycle')
     cal_sync.add_argument('--json', action='store_true', help='Output as JSON')
-    cal_sync.set_defaults(func=cmd_calendar_sync)
+    cal_sync.set_defaults(func='cmd_calendar_sync')
 
     cal_resolve = calendar_sub.add_parser('resolve', help='Resolve calendar task lifecycle')
-    cal_resolve.add_argument('--window', choices=['today', 'yesterday'], default='today')
+    cal_resolve.add_argument('--window', choices=_DAY_WINDOW_CHOICES, default='today')
     cal_resolve.add_argument('--json', action='store_true', help='Output as JSON')
-    cal_resolve.set_defaults(func=cmd_calendar_resolve)
+    cal_resolve.set_defaults(func='cmd_calendar_resolve')
 
-    objectives_parser = subparsers.add_parser('objectives', help='Show objective progress')
+
+def _configure_objectives_parser(objectives_parser):
     objectives_parser.add_argument('--json', action='store_true', help='Output as JSON')
     objectives_parser.add_argument(
         '--at-risk',
         action='store_true',
         help='Show only objectives with 0% completion',
     )
-    objectives_parser.set_defaults(func=cmd_objectives)
-    
-    # Parking Lot subcommands
-    pl_parser = subparsers.add_parser('parking-lot', help='Manage parking lot (backlog)')
+    objectives_parser.set_defaults(func='cmd_objectives')
+
+
+def _configure_parking_lot_parser(pl_parser):
+    pl_parser.set_defaults(func='cmd_parking_lot')
     pl_sub = pl_parser.add_subparsers(dest='pl_command', required=True)
 
-    pl_sub.add_parser('list', help='List parking lot items').set_defaults(func=cmd_parking_lot)
+    pl_sub.add_parser('list', help='List parking lot items')
 
     pl_add = pl_sub.add_parser('add', help='Add item to parking lot')
     pl_add.add_argument('title', help='Task title')
     pl_add.add_argument('--dept', help='Department tag (Dev, Sales, etc.)')
-    pl_add.add_argument('--priority', default='low', choices=['urgent', 'high', 'medium', 'low'])
-    pl_add.set_defaults(func=cmd_parking_lot)
+    pl_add.add_argument('--priority', default='low', choices=_PARKING_PRIORITY_CHOICES)
 
-    pl_sub.add_parser('stale', help='List stale items (JSON)').set_defaults(func=cmd_parking_lot)
+    pl_sub.add_parser('stale', help='List stale items (JSON)')
 
     pl_promote = pl_sub.add_parser('promote', help='Promote item to objectives')
     pl_promote.add_argument('id', type=int, help='Item ID from list')
-    pl_promote.set_defaults(func=cmd_parking_lot)
 
     pl_drop = pl_sub.add_parser('drop', help='Drop item (archive as dropped)')
     pl_drop.add_argument('id', type=int, help='Item ID from list')
-    pl_drop.set_defaults(func=cmd_parking_lot)
 
-    # Delegated subcommands
-    del_parser = subparsers.add_parser('delegated', help='Manage delegated tasks')
+
+def _configure_delegated_parser(del_parser):
+    del_parser.set_defaults(func='cmd_delegated')
     del_sub = del_parser.add_subparsers(dest='del_command', required=True)
 
     del_list = del_sub.add_parser('list', help='List delegated items')
     del_list.add_argument('--overdue', action='store_true', help='Show only overdue items')
     del_list.add_argument('--json', action='store_true', help='JSON output')
-    del_list.set_defaults(func=cmd_delegated)
 
     del_add = del_sub.add_parser('add', help='Delegate a task')
     del_add.add_argument('task', help='Task title')
     del_add.add_argument('--to', required=True, help='Person to delegate to')
     del_add.add_argument('--followup', required=True, help='Follow-up date (YYYY-MM-DD)')
     del_add.add_argument('--dept', help='Department tag')
-    del_add.set_defaults(func=cmd_delegated)
 
     del_complete = del_sub.add_parser('complete', help='Mark delegation as complete')
     del_complete.add_argument('id', type=int, help='Item ID from list')
-    del_complete.set_defaults(func=cmd_delegated)
 
     del_extend = del_sub.add_parser('extend', help='Extend follow-up date')
     del_extend.add_argument('id', type=int, help='Item ID from list')
     del_extend.add_argument('--followup', required=True, help='New follow-up date (YYYY-MM-DD)')
-    del_extend.set_defaults(func=cmd_delegated)
 
     del_takeback = del_sub.add_parser('take-back', help='Take back delegated task')
     del_takeback.add_argument('id', type=int, help='Item ID from list')
-    del_takeback.set_defaults(func=cmd_delegated)
 
-    promote_parser = subparsers.add_parser('promote-from-backlog', help='Promote top backlog item(s)')
+
+def _configure_promote_from_backlog_parser(promote_parser):
     promote_parser.add_argument('--cap', type=int, default=1, help='Max items to promote')
-    promote_parser.set_defaults(func=cmd_promote_from_backlog)
+    promote_parser.set_defaults(func='cmd_promote_from_backlog')
 
-    review_parser = subparsers.add_parser('review-backlog', help='Review stale backlog items')
-    review_parser.add_argument('--stale-days', type=int, default=int(os.getenv('PARKING_LOT_STALE_DAYS', '30')))
+
+def _configure_review_backlog_parser(review_parser):
+    review_parser.add_argument('--stale-days', type=int, default=None)
     review_parser.add_argument('--json', action='store_true')
-    review_parser.set_defaults(func=cmd_review_backlog)
+    review_parser.set_defaults(func='cmd_review_backlog')
+
+
+class _HelpFormatter(argparse.HelpFormatter):
+    """HelpFormatter that measures the terminal once per process.
 
-    args = parser.parse_args()
-    args.func(args)
+    argparse builds a throwaway formatter on every ``add_argument`` (to check
+    the metavar) and for each subparser's prog, and the stock formatter calls
+    ``shutil.get_terminal_size()`` each time. Output is unchanged.
+    """
+
+    _default_width: int | None = None
+
+    def __init__(self, prog, indent_increment=2, max_help_position=24, width=None):
+        if width is None:
+            if _HelpFormatter._default_width is None:
+                _HelpFormatter._default_width = shutil.get_terminal_size().columns - 2
+            width = _HelpFormatter._default_width
+        super().__init__(prog, indent_increment, max_help_position, width)
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser defaulting to ``_HelpFormatter``.
+
+    ``add_subparsers`` creates nested parsers with ``type(self)``, so every
+    subcommand parser picks up the cached-width formatter too.
+    """
+
+    def __init__(self, *args, formatter_class=_HelpFormatter, **kwargs):
+        super().__init__(*args, formatter_class=formatter_class, **kwargs)
+
+
+# Subcommand name -> (top-level help, configure function). The configure
+# function fills in the arguments and handler of an already-created
+# subparser. main() only configures the subcommand named on the command line,
+# so a single invocation never pays for constructing every sibling parser, and
+# top-level ``--help`` is rendered from the help strings alone. Insertion
+# order is the order commands are listed in ``--help``.
+_SUBCOMMANDS = {
+    'list': ('List tasks', _configure_list_parser),
+    'add': ('Add a task', _configure_add_parser),
+    'promote': ('Promote a parked task onto the active board (capacity-gated)', _configure_promote_parser),
+    'swap': ('Park an active task and promote a parked task into the freed slot', _configure_swap_parser),
+    'done': ('Mark task as done by canonical task_id', _configure_done_parser),
+    'revert': ('Revert a completion by completion_id', _configure_revert_parser),
+    'capture': (
+        'Capture a chat-stated completion on the work board. Raw text is '
+        'candidate-only; auto-write requires a verified gateway envelope.',
+        _configure_capture_parser,
+    ),
+    'remove': ('Cancel/remove a task from the board by canonical task_id', _configure_remove_parser),
+    'rollover': ('Regenerate the weekly board deterministically', _configure_rollover_parser),
+    'identity-audit': ('Read-only canonical identity audit', _configure_identity_audit_parser),
+    'task-audit': ('Read-only task health audit', _configure_task_audit_parser),
+    'identity-repair': ('Repair missing task_id metadata', _configure_identity_repair_parser),
+    'done-scan': ('Scan completed items from daily notes', _configure_done_scan_parser),
+    'daily-links': ('Generate daily note links', _configure_daily_links_parser),
+    'standup-summary': ('Return standup primitive summary JSON', _configure_standup_summary_parser),
+    'weekly-review-summary': ('Return weekly review primitive summary JSON', _configure_weekly_review_summary_parser),
+    'ingest-daily-log': ('Report done-line evidence links for canonical tasks', _configure_ingest_daily_log_parser),
+    'completion-candidates': ('Manage durable completion evidence candidates', _configure_completion_candidates_parser),
+    'calendar-sync': ('Optional helper payload for calendar lifecycle mapping', _configure_calendar_sync_parser),
+    'blockers': ('Show blocking tasks', _configure_blockers_parser),
+    'archive': ('Archive completed tasks', _configure_archive_parser),
+    'calendar': ('Calendar domain commands', _configure_calendar_parser),
+    'objectives': ('Show objective progress', _configure_objectives_parser),
+    'parking-lot': ('Manage parking lot (backlog)', _configure_parking_lot_parser),
+    'delegated': ('Manage delegated tasks', _configure_delegated_parser),
+    'promote-from-backlog': ('Promote top backlog item(s)', _configure_promote_from_backlog_parser),
+    'review-backlog': ('Review stale backlog items', _configure_review_backlog_parser),
+}
+
+
+def _requested_command(argv: list[str]) -> str | None:
+    """Return the known subcommand named in ``argv``, or None.
+
+    Global flags (``--personal``) may precede the subcommand, so leading option
+    tokens are skipped. ``-h``/``--help`` before any subcommand, an unknown
+    name, or no subcommand at all return None so the caller builds the
+    top-level parser and argparse produces its usual help or error output.
+    """
+    for token in argv:
+        if token in ('-h', '--help'):
+            return None
+        if token.startswith('-'):
+            continue
+        return token if token in _SUBCOMMANDS else None
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser, fully configuring only ``command``.
+
+    Every subcommand is registered by name and help so top-level usage, help
+    and error output list them all; only ``command`` (if any) gets its
+    arguments built, so no path constructs the other subcommands' arguments.
+
+    Parsers are cached per command so repeated in-process ``main()`` calls
+    reuse them; ``parse_args`` does not mutate a parser. ``func`` defaults
+    hold handler names, resolved at dispatch by ``_run_handler``, so a cached
+    parser never pins a stale (e.g. monkeypatched) handler.
+    """
+    parser = _ArgumentParser(description='Task Tracker CLI (Work & Personal)')
+    parser.add_argument('--personal', action='store_true', help='Use Personal Tasks instead of Work Tasks')
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (help_text, configure) in _SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name == command:
+            configure(subparser)
+    return parser
+
+
+def _promote_from_backlog_fast_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parse the cron form ``[--personal] promote-from-backlog [--cap N]`` directly.
+
+    Automation invokes this leaf on a schedule with at most a plain ``--cap``,
+    so that exact shape skips argparse entirely. Anything else (help, option
+    abbreviations, signed or malformed numbers, extra tokens) returns None and
+    goes through argparse for its usual validation and messages.
+    """
+    personal = argv[:1] == ['--personal']
+    rest = argv[1:] if personal else argv
+    if rest[:1] != ['promote-from-backlog']:
+        return None
+    rest = rest[1:]
+    if not rest:
+        raw_cap = '1'
+    elif len(rest) == 2 and rest[0] == '--cap':
+        raw_cap = rest[1]
+    elif len(rest) == 1 and rest[0].startswith('--cap='):
+        raw_cap = rest[0][len('--cap='):]
+    else:
+        return None
+    if not (raw_cap.isascii() and raw_cap.isdigit()):
+        return None
+    return argparse.Namespace(
+        personal=personal,
+        command='promote-from-backlog',
+        cap=int(raw_cap),
+        func='cmd_promote_from_backlog',
+    )
+
+
+def _run_handler(args: argparse.Namespace) -> None:
+    """Call the handler named by ``args.func``, looked up on this module now."""
+    getattr(sys.modules[__name__], args.func)(args)
+
+
+def main(argv: list[str] | None = None):
+    argv = sys.argv[1:] if argv is None else argv
+    args = _promote_from_backlog_fast_args(argv)
+    if args is not None:
+        _run_handler(args)
+        return
+    parser = _build_parser(_requested_command(argv))
+    args = parser.parse_args(argv)
+    _run_handler(args)
 
 
 if __name__ == '__main__':
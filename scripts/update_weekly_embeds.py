@@ -24,7 +24,6 @@ from __future__ import annotations
 
 import argparse
 import os
-import re
 import sys
 from datetime import datetime, timedelta, date
 from pathlib import Path
@@ -87,29 +86,54 @@ def build_progress_section(monday: date) -> str:
     """Build the full ## 📊 Daily Progress markdown block for the given week."""
     lines = [PROGRESS_SECTION_HEADER, ""]
     for i, day_name in enumerate(DAYS_OF_WEEK):
-        day = monday + timedelta(days=i)
-        date_str = day.strftime("%Y-%m-%d")
-        lines.append(f"### {day_name}")
-        lines.append(f"![[{VAULT_PREFIX}/{date_str}#{DONE_ANCHOR}]]")
-        lines.append("")
+        date_str = (monday + timedelta(days=i)).isoformat()
+        lines.extend((f"### {day_name}", f"![[{VAULT_PREFIX}/{date_str}#{DONE_ANCHOR}]]", ""))
     return "\n".join(lines)
 
 
-# Regex to find the ## 📊 Daily Progress section (greedy to end of file or
-# until the next ## heading).
-_PROGRESS_SECTION_RE = re.compile(
-    r"(^## 📊 Daily Progress\s*\n)"  # opening header
-    r"(.*?)"                          # section body (non-greedy)
-    r"(?=^##\s|\Z)",                  # lookahead: next ## or EOF
-    re.MULTILINE | re.DOTALL,
-)
+def _progress_section_span(content: str) -> tuple[int, int] | None:
+    """Return ``(start, end)`` of the existing progress section, or None.
+
+    The section is a line-start ``PROGRESS_SECTION_HEADER`` followed only by
+    whitespace through a newline, and runs to the next ``## `` heading or EOF.
+    Located with ``str.find`` rather than a DOTALL regex over the document.
+    """
+    start = content.find(PROGRESS_SECTION_HEADER)
+    while start != -1:
+        after_header = start + len(PROGRESS_SECTION_HEADER)
+        if start == 0 or content[start - 1] == "\n":
+            # The header's trailing whitespace may span blank lines; the body
+            # starts after the last newline in that run.
+            pos = after_header
+            body_start = -1
+            while pos < len(content) and content[pos].isspace():
+                if content[pos] == "\n":
+                    body_start = pos + 1
+                pos += 1
+            if body_start != -1:
+                return start, _next_h2_start(content, body_start)
+        start = content.find(PROGRESS_SECTION_HEADER, after_header)
+    return None
+
+
+def _next_h2_start(content: str, pos: int) -> int:
+    """Offset of the first ``##<whitespace>`` line at or after line start ``pos``."""
+    if content.startswith("##", pos) and content[pos + 2 : pos + 3].isspace():
+        return pos
+    heading = content.find("\n##", pos)
+    while heading != -1:
+        if content[heading + 3 : heading + 4].isspace():
+            return heading + 1
+        heading = content.find("\n##", heading + 3)
+    return len(content)
 
 
 def update_or_append_progress_section(content: str, new_section: str) -> str:
     """Replace existing progress section or append at end of file."""
     replacement = new_section + "\n\n"
-    if _PROGRESS_SECTION_RE.search(content):
-        return _PROGRESS_SECTION_RE.sub(replacement, content, count=1)
+    span = _progress_section_span(content)
+    if span is not None:
+        return content[: span[0]] + replacement + content[span[1] :]
     # Not found — append before the Tasks Query block if present, else at end
     tasks_query_marker = "## 📋 Tasks Query"
     if tasks_query_marker in content:
@@ -158,7 +182,7 @@ def main() -> None:
     monday = get_week_monday(ref_date)
     week_str = monday.strftime("%Y-W%V")
 
-    print(f"📅 Week: {week_str} (Mon {monday.strftime('%Y-%m-%d')})")
+    print(f"📅 Week: {week_str} (Mon {monday.isoformat()})")
 
     new_section = build_progress_section(monday)
 
@@ -10,6 +10,7 @@ Configuration via environment variables:
 - TASK_TRACKER_ARCHIVE_DIR: Path to archive directory
 """
 
+import json
 import os
 import re
 import calendar
@@ -102,6 +103,16 @@ def _atomic_write(path: Path, content: str) -> None:
         pass
 
 
+def dump_json(payload) -> str:
+    """Serialize ``payload`` as 2-space indented JSON text.
+
+    The single encoder for ``--json`` payloads and error envelopes. It stays
+    on the stdlib encoder so output is byte-identical on every host: non-ASCII
+    is ``\\u``-escaped, and surrogate-escaped argv/env paths still encode.
+    """
+    return json.dumps(payload, indent=2)
+
+
 def get_current_quarter() -> str:
     """Return current quarter string like '2026-Q1'."""
     now = datetime.now()
@@ -167,6 +178,47 @@ PRIORITY_TO_SECTION = {
 }
 
 
+# Patterns used by ``detect_format`` / ``parse_tasks`` on every board line,
+# compiled once here rather than looked up in ``re``'s cache per call.
+_OBJECTIVES_FORMAT_RE = re.compile(r'^\s*##\s+Objectives\b', re.IGNORECASE | re.MULTILINE)
+_OBSIDIAN_FORMAT_RE = re.compile(r'^\s*##\s+🔴(?:\s|$)', re.MULTILINE)
+_TITLE_TAG_RE = re.compile(r'(^|\s)#([A-Za-z][A-Za-z0-9_-]*)')
+_MULTI_SPACE_RE = re.compile(r'\s{2,}')
+_PLAIN_BODY_MARKER_RE = re.compile(
+    r'\s+(🗓️\s*\d{4}-\d{2}-\d{2}|📅\d{4}-\d{2}-\d{2}|📅\s+\d{4}-\d{2}-\d{2}|🔺|⏫|🔼|🔽|⏬|(?:area|goal|owner|blocks|type|recur|estimate|depends|sprint|task_id|id)::)'
+)
+_OBJECTIVES_HEADER_RE = re.compile(r'##\s+Objectives\b', re.IGNORECASE)
+_TODAY_HEADER_RE = re.compile(r'##\s+Today(?::.*)?$', re.IGNORECASE)
+_PARKING_LOT_HEADER_RE = re.compile(r'##\s+(?:🅿️\s*)?Parking Lot\b', re.IGNORECASE)
+# Single-code-point section emoji read straight after a '## ' prefix.
+_SECTION_EMOJIS = frozenset('🔴🟡🟠👥⚪✅')
+_DEPARTMENT_HEADER_RE = re.compile(r'###\s+[^\s]+\s+([A-Za-z]+)\s*#?')
+_TASK_LINE_RE = re.compile(r'^(\s*)- \[([ xX])\] (.+)$')
+_TASK_CHECKBOX_RE = re.compile(r'^\s*- \[([ xX])\] ')
+_COMPLETED_SUFFIX_RE = re.compile(r'✅\s*(\d{4}-\d{2}-\d{2})\s*$')
+_BOLD_TITLE_RE = re.compile(r'^\*\*(.+?)\*\*(.*)$')
+_CALENDAR_DUE_RE = re.compile(r'🗓️\s*(\d{4}-\d{2}-\d{2})')
+_TASKS_PLUGIN_DUE_RE = re.compile(r'📅\s*(\d{4}-\d{2}-\d{2})')
+# Multi-word ``field:: value`` runs up to the next field; the second group
+# also stops recur/estimate/depends/sprint at a trailing 🗓️ due date.
+_INLINE_FIELD_RES = {
+    **{
+        name: re.compile(rf'(?<!\w){name}::\s*(?!(\s|\w+::))([^\n]+?)(?=\s+\w+::|$)')
+        for name in ('area', 'owner', 'blocks', 'type')
+    },
+    **{
+        name: re.compile(rf'(?<!\w){name}::\s*(?!(\s|\w+::))([^\n]+?)(?=\s+\w+::|\s*🗓️|$)')
+        for name in ('recur', 'estimate', 'depends', 'sprint')
+    },
+}
+# Every ``name::`` marker not glued to a preceding word, i.e. exactly the
+# positions where one of the field patterns below can start.
+_FIELD_MARKER_RE = re.compile(r'(?<!\w)(\w+)::')
+_GOAL_FIELD_RE = re.compile(r'(?<!\w)goal::\s*(\[\[[^\]]+\]\]|[^\s]+)')
+_TASK_ID_FIELD_RE = re.compile(r'(?<!\w)task_id::\s*([A-Za-z0-9._:-]*[A-Za-z0-9._-])(?=\s|$|[),.;!?])')
+_LEGACY_ID_FIELD_RE = re.compile(r'(?<!\w)id::\s*([A-Za-z0-9._:-]*[A-Za-z0-9._-])(?=\s|$|[),.;!?])')
+
+
 def detect_format(content: str, fallback: str = 'obsidian') -> str:
     """Detect task format from content.
 
@@ -174,16 +226,14 @@ def detect_format(content: str, fallback: str = 'obsidian') -> str:
     Otherwise respects the caller's fallback hint so that legacy
     callers are not silently reclassified as obsidian.
     """
-    if re.search(r'^\s*##\s+Objectives\b', content, re.IGNORECASE | re.MULTILINE):
+    if _OBJECTIVES_FORMAT_RE.search(content):
         return 'objectives'
-    if fallback not in ('obsidian', 'objectives') and re.search(
-        r'^\s*##\s+🔴(?:\s|$)', content, re.MULTILINE
-    ):
+    if fallback not in ('obsidian', 'objectives') and _OBSIDIAN_FORMAT_RE.search(content):
         # Caller explicitly requested a non-default format (e.g. 'legacy').
         # Don't override it just because 🔴 is present — both obsidian and
         # legacy use that emoji.
         return fallback
-    if re.search(r'^\s*##\s+🔴(?:\s|$)', content, re.MULTILINE):
+    if _OBSIDIAN_FORMAT_RE.search(content):
         return 'obsidian'
     return fallback
 
@@ -208,17 +258,14 @@ def _extract_tags_from_title(title: str) -> tuple[str, str | None, str | None]:
             return prefix
         return match.group(0)
 
-    cleaned = re.sub(r'(^|\s)#([A-Za-z][A-Za-z0-9_-]*)', _replace, title)
-    cleaned = re.sub(r'\s{2,}', ' ', cleaned).strip()
+    cleaned = _TITLE_TAG_RE.sub(_replace, title)
+    cleaned = _MULTI_SPACE_RE.sub(' ', cleaned).strip()
     return cleaned, department, priority
 
 
 def _split_plain_task_body(task_body: str) -> tuple[str, str]:
     """Split plain task body into title and metadata suffix."""
-    marker_match = re.search(
-        r'\s+(🗓️\s*\d{4}-\d{2}-\d{2}|📅\d{4}-\d{2}-\d{2}|📅\s+\d{4}-\d{2}-\d{2}|🔺|⏫|🔼|🔽|⏬|(?:area|goal|owner|blocks|type|recur|estimate|depends|sprint|task_id|id)::)',
-        task_body,
-    )
+    marker_match = _PLAIN_BODY_MARKER_RE.search(task_body)
     if marker_match:
         return task_body[:marker_match.start()].strip(), task_body[marker_match.start():].strip()
     return task_body.strip(), ''
@@ -281,7 +328,7 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
     current_department = None  # Track department from ### lines
     current_task = None
     current_objective = None
-    today = cos_config.local_today()  # local (Pacific) day for the due-today check below
+    today_iso = cos_config.local_today().isoformat()  # local (Pacific) day for the due-today check below
 
     for line_number, line in enumerate(content.split('\n'), start=1):
         # Detect section headers
@@ -289,28 +336,22 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
             current_task = None
             current_department = None  # Reset department at new section
             if parsed_format == 'objectives':
-                if re.match(r'##\s+Objectives\b', line, re.IGNORECASE):
+                if _OBJECTIVES_HEADER_RE.match(line):
                     current_section = 'objectives'
                     current_objective = None
-                elif re.match(r'##\s+Today(?::.*)?$', line, re.IGNORECASE):
+                elif _TODAY_HEADER_RE.match(line):
                     current_section = 'today'
                     current_objective = None
-                elif re.match(r'##\s+🅿️\s*Parking Lot\b', line, re.IGNORECASE) or re.match(
-                    r'##\s+Parking Lot\b',
-                    line,
-                    re.IGNORECASE,
-                ):
+                elif _PARKING_LOT_HEADER_RE.match(line):
                     current_section = 'parking_lot'
                     current_objective = None
                 else:
-                    section_match = re.match(r'## ([🔴🟡🟠👥⚪✅])', line)
-                    current_section = mapping.get(section_match.group(1)) if section_match else None
+                    current_section = mapping.get(line[3:4])
                     current_objective = None
             elif parsed_format in ('obsidian', 'legacy'):
                 # Match emoji at start of section name (both formats use same emoji headers)
-                section_match = re.match(r'## ([🔴🟡🟠👥⚪✅])', line)
-                if section_match:
-                    emoji = section_match.group(1)
+                emoji = line[3:4]
+                if emoji in _SECTION_EMOJIS:
                     current_section = mapping.get(emoji)
             continue
         
@@ -319,7 +360,7 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
         if line.startswith('### '):
             # Extract department from ### line for metadata, but preserve parent section
             # Don't reset current_section - ### headers are organizational only
-            section_match = re.match(r'###\s+[^\s]+\s+([A-Za-z]+)\s*#?', line)
+            section_match = _DEPARTMENT_HEADER_RE.match(line)
             if section_match:
                 current_department = section_match.group(1).title()
             current_objective = None
@@ -329,7 +370,10 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
         # Format examples:
         # - [ ] **Task name** 🗓️2026-01-22 area:: Sales
         # - [ ] Task name #HR #high
-        task_match = re.match(r'^(\s*)- \[([ xX])\] (.+)$', line)
+        # Every checkbox line contains "- [", so prose/notes lines skip the
+        # regex (the pattern itself allows leading indentation).
+        has_checkbox = '- [' in line
+        task_match = _TASK_LINE_RE.match(line) if has_checkbox else None
         
         if task_match:
             indent = task_match.group(1)
@@ -340,13 +384,13 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
             # Parse completion timestamp suffix on done tasks:
             # "... ✅ YYYY-MM-DD" or "... ✅YYYY-MM-DD"
             if done:
-                completed_match = re.search(r'✅\s*(\d{4}-\d{2}-\d{2})\s*$', body)
+                completed_match = _COMPLETED_SUFFIX_RE.search(body)
                 if completed_match:
                     completed_date = completed_match.group(1)
                     # Strip completion suffix before parsing inline fields
                     body = body[:completed_match.start()].rstrip()
 
-            bold_match = re.match(r'^\*\*(.+?)\*\*(.*)$', body)
+            bold_match = _BOLD_TITLE_RE.match(body)
             if bold_match:
                 title = bold_match.group(1).strip()
                 rest = bold_match.group(2).strip()
@@ -383,15 +427,17 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
                     current_objective = None
 
             if parsed_format in ('obsidian', 'objectives', 'legacy'):
-                # Parse emoji date
-                date_match = re.search(r'🗓️\s*(\d{4}-\d{2}-\d{2})', rest)
-                if date_match:
-                    due_str = date_match.group(1)
+                # Parse emoji date (substring gates skip the regex for undated tasks)
+                if '🗓️' in rest:
+                    date_match = _CALENDAR_DUE_RE.search(rest)
+                    if date_match:
+                        due_str = date_match.group(1)
                 
                 # NEW: Parse 📅 YYYY-MM-DD format (Tasks plugin)
-                date_match = re.search(r'📅\s*(\d{4}-\d{2}-\d{2})', rest)
-                if date_match:
-                    due_str = date_match.group(1)
+                if '📅' in rest:
+                    date_match = _TASKS_PLUGIN_DUE_RE.search(rest)
+                    if date_match:
+                        due_str = date_match.group(1)
                 
                 # NEW: Parse priority emojis 🔺 ⏫ 🔼 🔽 ⏬
                 for emoji, prio in PRIORITY_EMOJI_MAP.items():
@@ -402,50 +448,40 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
                 
                 # Parse inline fields (handle multi-word values)
                 # Pattern: field:: value (but not field:: next_field::)
-                area_match = re.search(r'(?<!\w)area::\s*(?!(\s|\w+::))([^\n]+?)(?=\s+\w+::|$)', rest)
-                if area_match:
-                    area = area_match.group(2).strip()
-                
-                goal_match = re.search(r'(?<!\w)goal::\s*(\[\[[^\]]+\]\]|[^\s]+)', rest)
-                if goal_match:
-                    goal = goal_match.group(1).strip()
-                
-                owner_match = re.search(r'(?<!\w)owner::\s*(?!(\s|\w+::))([^\n]+?)(?=\s+\w+::|$)', rest)
-                if owner_match:
-                    owner = owner_match.group(2).strip()
-
-                blocks_match = re.search(r'(?<!\w)blocks::\s*(?!(\s|\w+::))([^\n]+?)(?=\s+\w+::|$)', rest)
-                if blocks_match:
-                    blocks = blocks_match.group(2).strip()
-
-                type_match = re.search(r'(?<!\w)type::\s*(?!(\s|\w+::))([^\n]+?)(?=\s+\w+::|$)', rest)
-                if type_match:
-                    task_type = type_match.group(2).strip()
-
-                recur_match = re.search(r'(?<!\w)recur::\s*(?!(\s|\w+::))([^\n]+?)(?=\s+\w+::|\s*🗓️|$)', rest)
-                if recur_match:
-                    recur = recur_match.group(2).strip()
-
-                estimate_match = re.search(r'(?<!\w)estimate::\s*(?!(\s|\w+::))([^\n]+?)(?=\s+\w+::|\s*🗓️|$)', rest)
-                if estimate_match:
-                    estimate = estimate_match.group(2).strip()
+                # One marker scan finds which fields are present; only those
+                # run their own value pattern, so plain task lines skip the
+                # per-field searches entirely.
+                present = {m.group(1) for m in _FIELD_MARKER_RE.finditer(rest)} if '::' in rest else ()
+                if present:
+                    fields = {}
+                    for name in present.intersection(_INLINE_FIELD_RES):
+                        field_match = _INLINE_FIELD_RES[name].search(rest)
+                        if field_match:
+                            fields[name] = field_match.group(2).strip()
+                    area = fields.get('area')
+                    owner = fields.get('owner')
+                    blocks = fields.get('blocks')
+                    task_type = fields.get('type')
+                    recur = fields.get('recur')
+                    estimate = fields.get('estimate')
+                    depends = fields.get('depends')
+                    sprint = fields.get('sprint')
+
+                    if 'goal' in present:
+                        goal_match = _GOAL_FIELD_RE.search(rest)
+                        if goal_match:
+                            goal = goal_match.group(1).strip()
+
+                    if 'task_id' in present:
+                        task_id_match = _TASK_ID_FIELD_RE.search(rest)
+                        if task_id_match:
+                            task_id = task_id_match.group(1).strip()
+
+                    if 'id' in present:
+                        legacy_id_match = _LEGACY_ID_FIELD_RE.search(rest)
+                        if legacy_id_match:
+                            legacy_id = legacy_id_match.group(1).strip()
 
-                depends_match = re.search(r'(?<!\w)depends::\s*(?!(\s|\w+::))([^\n]+?)(?=\s+\w+::|\s*🗓️|$)', rest)
-                if depends_match:
-                    depends = depends_match.group(2).strip()
-
-                sprint_match = re.search(r'(?<!\w)sprint::\s*(?!(\s|\w+::))([^\n]+?)(?=\s+\w+::|\s*🗓️|$)', rest)
-                if sprint_match:
-                    sprint = sprint_match.group(2).strip()
-
-                task_id_match = re.search(r'(?<!\w)task_id::\s*([A-Za-z0-9._:-]*[A-Za-z0-9._-])(?=\s|$|[),.;!?])', rest)
-                if task_id_match:
-                    task_id = task_id_match.group(1).strip()
-
-                legacy_id_match = re.search(r'(?<!\w)id::\s*([A-Za-z0-9._:-]*[A-Za-z0-9._-])(?=\s|$|[),.;!?])', rest)
-                if legacy_id_match:
-                    legacy_id = legacy_id_match.group(1).strip()
-            
             current_task = {
                 'title': title,
                 'done': done,
@@ -483,19 +519,16 @@ def parse_tasks(content: str, personal: bool = False, format: str = 'obsidian')
                 if mapped_section and current_task not in result[mapped_section]:
                     result[mapped_section].append(current_task)
             
-            # Check if due today (only for tasks WITH a due date)
-            if due_str and not done:
-                try:
-                    due_date = datetime.strptime(due_str, '%Y-%m-%d').date()
-                    if due_date == today:
-                        result['due_today'].append(current_task)
-                except ValueError:
-                    pass
+            # Check if due today (only for tasks WITH a due date). due_str is
+            # always a zero-padded YYYY-MM-DD capture here, so comparing it to
+            # today's ISO string is the same test as comparing parsed dates.
+            if due_str and not done and due_str == today_iso:
+                result['due_today'].append(current_task)
             
             continue
         
         # Handle task continuation (indented lines)
-        if current_task and line.startswith('  ') and not re.match(r'^\s*- \[([ xX])\] ', line):
+        if current_task and line.startswith('  ') and not (has_checkbox and _TASK_CHECKBOX_RE.match(line)):
             meta_line = line.strip()
             
             # Remove leading "- " if present
@@ -536,21 +569,41 @@ def load_tasks(personal: bool = False, force_legacy: bool = False) -> tuple[str,
     return content, tasks
 
 
-def check_due_date(due: str, check_type: str = 'today') -> bool:
-    """Check if a due date matches the given type."""
+def parse_due_date(due: str) -> date:
+    """Parse a ``YYYY-MM-DD`` due value exactly as ``strptime('%Y-%m-%d')`` would.
+
+    Due values can come verbatim from a hand-written ``Due:`` line, so unpadded
+    dates like ``2026-3-1`` must still parse and compact ``20260301`` must not.
+    The common zero-padded form takes the faster ``date.fromisoformat`` path.
+    Raises ``ValueError`` for anything else.
+    """
+    if len(due) == 10 and due[4] == '-' and due[7] == '-':
+        try:
+            return date.fromisoformat(due)
+        except ValueError:
+            pass
+    return datetime.strptime(due, '%Y-%m-%d').date()
+
+
+def check_due_date(due: str, check_type: str = 'today', *, today: date | None = None) -> bool:
+    """Check if a due date matches the given type.
+
+    Pass ``today`` when classifying many tasks so the local day is resolved
+    once per call site instead of once per task.
+    """
     if not due:
         return False  # Tasks without due dates don't match any filter
 
-    today = cos_config.local_today()  # local (Pacific) day: this is the overdue/today/this-week classifier
-    week_end = today + timedelta(days=(6 - today.weekday()))
+    if today is None:
+        today = cos_config.local_today()  # local (Pacific) day: this is the overdue/today/this-week classifier
     
     try:
-        due_date = datetime.strptime(due, '%Y-%m-%d').date()
+        due_date = parse_due_date(due)
         
         if check_type == 'today':
             return due_date == today
         elif check_type == 'this-week':
-            return today <= due_date <= week_end
+            return today <= due_date <= today + timedelta(days=(6 - today.weekday()))
         elif check_type == 'due-or-overdue':
             return due_date <= today
         elif check_type == 'overdue':
@@ -694,7 +747,7 @@ def get_missed_tasks(tasks_data: dict, lookback_days: int = 1, reference_date: s
             continue
 
         try:
-            due_date = datetime.strptime(due_str, '%Y-%m-%d').date()
+            due_date = parse_due_date(due_str)
         except ValueError:
             continue
 
@@ -741,7 +794,7 @@ def get_missed_tasks_bucketed(tasks_data: dict, reference_date: str = None) -> d
             continue
 
         try:
-            due_date = datetime.strptime(due_str, '%Y-%m-%d').date()
+            due_date = parse_due_date(due_str)
         except ValueError:
             continue
 
@@ -824,7 +877,7 @@ def effective_priority(task: dict, reference_date=None) -> dict:
         }
 
     try:
-        due_date = _dt.strptime(due_str, '%Y-%m-%d').date()
+        due_date = parse_due_date(due_str)
     except ValueError:
         return {
             'section': section,
@@ -15,7 +15,7 @@ import error_envelope
 from candidate_review import candidate_review_summary
 from task_audit import task_audit_summary
 from daily_notes import extract_completed_actions, extract_completed_tasks
-from task_lines import remove_task_line
+from task_lines import remove_task_lines
 from utils import (
     get_tasks_file,
     ARCHIVE_DIR,
@@ -86,7 +86,7 @@ def _parse_archive_weeks(archive_dir: Path) -> dict[str, list[str]]:
                 completed_match = re.search(r'✅\s*(\d{4}-\d{2}-\d{2})\s*$', rest)
                 if completed_match:
                     try:
-                        c_date = datetime.strptime(completed_match.group(1), '%Y-%m-%d').date()
+                        c_date = date.fromisoformat(completed_match.group(1))
                         iso_year, iso_week, _ = c_date.isocalendar()
                         task_week = f"{iso_year}-W{iso_week:02d}"
                     except ValueError:
@@ -248,15 +248,10 @@ def _clean_stale_done_lines(tasks_file: Path, done_tasks: list[dict]) -> int:
     if not done_tasks or not tasks_file.exists():
         return 0
 
-    content = tasks_file.read_text()
-    removed = 0
-    for task in sorted(done_tasks, key=lambda item: item.get('line_number') or 0, reverse=True):
-        raw_line = task.get('raw_line', '')
-        line_number = task.get('line_number')
-        updated = remove_task_line(content, raw_line, line_number)
-        if updated is not None:
-            content = updated
-            removed += 1
+    content, removed = remove_task_lines(
+        tasks_file.read_text(),
+        ((task.get('raw_line', ''), task.get('line_number')) for task in done_tasks),
+    )
 
     if removed:
         tasks_file.write_text(content)
@@ -420,7 +415,7 @@ def extract_lessons(notes_dir: Path, start_date: date, end_date: date) -> list[s
             continue
 
         try:
-            note_date = datetime.strptime(match.group(1), "%Y-%m-%d").date()
+            note_date = date.fromisoformat(match.group(1))
         except ValueError:
             continue
 
@@ -4,7 +4,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
 
-from daily_notes import _clean_action_line, extract_completed_tasks
+from daily_notes import _clean_action_line, extract_completed_tasks, iter_completed_tasks
 
 
 def test_clean_action_line_strips_done_date_stamp():
@@ -57,3 +57,40 @@ def test_extract_completed_tasks_deduplicates_by_title_and_date(tmp_path):
         ("Ship release", "2026-02-11"),
         ("Ship release", "2026-02-12"),
     ]
+
+
+def test_iter_completed_tasks_reads_notes_lazily(tmp_path):
+    (tmp_path / "2026-02-10.md").write_text("- 09:00 ✅ Ship alpha\n")
+    (tmp_path / "2026-02-11.md").write_text("- 10:00 ✅ Ship beta\n- 11:00 ✅ ship alpha\n")
+
+    items = iter_completed_tasks(tmp_path, date(2026, 2, 11), date(2026, 2, 10))
+    first = next(items)
+    (tmp_path / "2026-02-11.md").write_text("- 12:00 ✅ Late edit\n")
+
+    assert first["title"] == "Ship alpha"
+    assert [item["title"] for item in items] == ["Late edit"]
+    assert extract_completed_tasks(tmp_path, date(2026, 2, 10), date(2026, 2, 11)) == [
+        first,
+        {**first, "title": "Late edit", "completed_date": "2026-02-11", "timestamp": "12:00"},
+    ]
+
+
+def test_iter_completed_tasks_missing_dir_yields_nothing(tmp_path):
+    assert list(iter_completed_tasks(tmp_path / "missing", date(2026, 2, 10), date(2026, 2, 11))) == []
+
+
+def test_note_lookup_by_day_matches_directory_listing(tmp_path, monkeypatch):
+    import daily_notes
+
+    for name in ("2026-01-31.md", "2026-02-01.md", "2026-02-03.md", "2026-02-30.md", "notes.md", "2026-02-02.txt"):
+        (tmp_path / name).write_text("- [x] Ship it ✅ 2026-02-01\n")
+    (tmp_path / "2026-02-04.md").mkdir()
+
+    start, end = date(2026, 2, 3), date(2026, 1, 1)
+    by_day = extract_completed_tasks(notes_dir=tmp_path, start_date=start, end_date=end)
+    monkeypatch.setattr(daily_notes, "_DIRECT_NOTE_LOOKUP_DAYS", 0)
+    by_listing = extract_completed_tasks(notes_dir=tmp_path, start_date=start, end_date=end)
+
+    assert by_day == by_listing
+    assert [task["completed_date"] for task in by_day] == ["2026-01-31", "2026-02-01", "2026-02-03"]
+    assert daily_notes.extract_completed_actions(tmp_path, start, end) == ["Ship it"]
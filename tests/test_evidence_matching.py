@@ -0,0 +1,171 @@
+"""Tests for shared completion-evidence matching helpers."""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import evidence_matching
+from evidence_matching import _candidate_sort_key, _top_fuzzy_matches, fuzzy_score
+
+
+def _catalog(titles):
+    return [
+        {"canonical": {"task_id": f"tsk_{i:03d}"}, "normalized_title": title}
+        for i, title in enumerate(titles)
+    ]
+
+
+def _brute_force(title, catalog, limit):
+    scored = [(fuzzy_score(title, c["normalized_title"]), _candidate_sort_key(c), c) for c in catalog]
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return scored[:max(0, limit)]
+
+
+def test_top_fuzzy_matches_equals_scoring_every_candidate():
+    rng = random.Random(7)
+    words = ["fix", "login", "timeout", "ship", "alpha", "review", "docs", "api", "deploy", "bug"]
+    titles = [" ".join(rng.choice(words) for _ in range(rng.randint(1, 5))) for _ in range(200)]
+    titles += ["", "fix login timeout", "fix login timeout"]
+    catalog = _catalog(titles)
+
+    for query in ["fix login timeout", "ship alpha docs", "deploy", "zzz", ""]:
+        for limit in (0, 1, 5):
+            assert _top_fuzzy_matches(query, catalog, limit) == _brute_force(query, catalog, limit)
+
+
+def test_top_fuzzy_matches_breaks_score_ties_by_sort_key():
+    catalog = _catalog(["ship alpha", "ship alpha", "ship beta"])[::-1]
+    top = _top_fuzzy_matches("ship alpha", catalog, 2)
+    assert [sort_key for _score, sort_key, _candidate in top] == ["tsk_000", "tsk_001"]
+
+
+def test_top_fuzzy_matches_many_equals_per_query_scoring():
+    rng = random.Random(11)
+    words = ["fix", "login", "timeout", "ship", "alpha", "review", "docs", "api", "deploy", "bug"]
+    catalog = _catalog([" ".join(rng.choice(words) for _ in range(rng.randint(0, 4))) for _ in range(120)])
+    queries = ["fix login timeout", "", "ship alpha docs", "zzz", "fix login timeout"]
+
+    for limit in (0, 1, 3):
+        rows = evidence_matching._top_fuzzy_matches_many(queries, catalog, limit)
+        assert rows == [_brute_force(query, catalog, limit) for query in queries]
+
+
+def test_match_evidence_lines_equals_matching_each_line():
+    catalog = _catalog(["ship alpha release", "fix login timeout", "review api docs", "deploy beta"])
+    for entry, identifiers in zip(catalog, ({"tsk_000"}, set(), {"gh:acme/app#7"}, set())):
+        entry["exact_identifiers"] = identifiers
+        entry["fallback_identifiers"] = {f"gh-issue-num:{value.rsplit('#', 1)[1]}" for value in identifiers if "#" in value}
+    lines = evidence_matching.extract_done_lines(
+        "- [x] Ship alpha release\n"
+        "- [x] Closed acme/app#7\n"
+        "- [x] Fixed #7 follow-up\n"
+        "- [x] Fix the login timeouts\n"
+        "- [x] Wash the car\n"
+        "- [x] task::tsk_000 done\n"
+    )
+
+    batched = evidence_matching.match_evidence_lines(lines, catalog, auto_threshold=0.92, review_threshold=0.6)
+
+    assert batched == [
+        evidence_matching.match_evidence_line(line, catalog, auto_threshold=0.92, review_threshold=0.6)
+        for line in lines
+    ]
+    assert [item["match_metadata"]["match_type"] for item in batched] == [
+        "normalized-title",
+        "exact-id-or-link",
+        "issue-number-fallback",
+        "fuzzy",
+        "fuzzy",
+        "exact-id-or-link",
+    ]
+
+
+def test_indexed_candidates_match_linear_scan_order():
+    rng = random.Random(5)
+    catalog = _catalog([rng.choice(["ship alpha", "fix bug", ""]) for _ in range(60)])
+    for entry in catalog:
+        entry["canonical"]["task_id"] = rng.choice(["tsk_a", "tsk_b", "tsk_c", None])
+        entry["exact_identifiers"] = set(rng.sample(["x", "y", "z"], rng.randint(0, 2)))
+        entry["fallback_identifiers"] = set()
+    index = evidence_matching._catalog_index(catalog)
+
+    for keys in ({"x"}, {"y", "z"}, set(), {"missing"}):
+        expected = [c for c in sorted(catalog, key=_candidate_sort_key) if keys & c["exact_identifiers"]]
+        found = evidence_matching._indexed_candidates(keys, index["exact"], catalog)
+        assert [id(c) for c in found] == [id(c) for c in expected]
+    for title in ("ship alpha", ""):
+        expected = [c for c in sorted(catalog, key=_candidate_sort_key) if c["normalized_title"] == title]
+        found = evidence_matching._indexed_candidates((title,), index["title"], catalog)
+        assert [id(c) for c in found] == [id(c) for c in expected]
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("- [x] **Ship** the release!", "- ship the release"),
+        ("✅ __Follow-up__ w/ vendor; re: Q3", "follow-up w/ vendor re q3"),
+        ("  ~~Old~~   item\t(done)  ", "old item done"),
+        ("a*[x]*b", "a b"),
+        (None, ""),
+    ],
+)
+def test_normalize_title_collapses_markup_and_separators(title, expected):
+    assert evidence_matching.normalize_title(title) == expected
+
+
+def test_normalize_title_is_memoized():
+    evidence_matching.normalize_title.cache_clear()
+    evidence_matching.normalize_title("Draft **plan**")
+    evidence_matching.normalize_title("Draft **plan**")
+    assert evidence_matching.normalize_title.cache_info().hits == 1
+
+
+def test_extract_inline_identifiers_keeps_overlapping_matches():
+    found = evidence_matching.extract_inline_identifiers(
+        "Fix https://github.com/Acme/App/issues/42?ref=task::tsk_9 see acme/app#42"
+    )
+    assert found["exact"] == {
+        "https://github.com/acme/app/issues/42?ref=task::tsk_9",
+        "gh:acme/app#42",
+        "tsk_9",
+    }
+    assert found["fallback"] == {"gh-issue-num:42"}
+
+
+def test_extract_inline_identifiers_plain_title():
+    assert evidence_matching.extract_inline_identifiers("Review Q3 budget") == {"exact": set(), "fallback": set()}
+
+
+@pytest.mark.parametrize(
+    ("content", "titles"),
+    [
+        ("- [x] Ship alpha ✅ 2026-02-11", ["Ship alpha"]),
+        ("* [X] 09:15 ✅ Fix login", ["Fix login"]),
+        ("  + 10:30:05 Deploy beta", ["Deploy beta"]),
+        ("✅ Sent invoice", ["Sent invoice"]),
+        ("- [ ] Still open\n\n- [x] ✅", []),
+        ("Plain note line", ["Plain note line"]),
+        ("- [x]   \n- 10:30\t", ["[x]", "10:30"]),
+    ],
+)
+def test_extract_done_lines_cleans_titles(content, titles):
+    assert [line["title"] for line in evidence_matching.extract_done_lines(content)] == titles
+
+
+def test_fuzzy_score_identical_inputs_skip_sequence_matcher(monkeypatch):
+    def boom(*_args, **_kwargs):
+        raise AssertionError("SequenceMatcher should not run on identical inputs")
+
+    monkeypatch.setattr(evidence_matching, "SequenceMatcher", boom)
+    assert fuzzy_score("ship alpha", "ship alpha") == 1.0
+    assert fuzzy_score("", "") == 0.0
+
+
+def test_extract_done_lines_from_matches_string_parser():
+    content = "- Shipped beta\n\n- [x] Ship alpha\n- [ ] Open item\r\n✅ Fix login tsk_abc123\n"
+    assert evidence_matching.extract_done_lines_from(content.splitlines()) == evidence_matching.extract_done_lines(content)
+    assert [line["line_number"] for line in evidence_matching.extract_done_lines(content)] == [1, 3, 5]
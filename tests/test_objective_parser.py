@@ -3,7 +3,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
 
-from task_lines import remove_task_line
+from task_lines import remove_task_line, remove_task_lines, split_task_block, task_line_block
 from utils import detect_format, parse_tasks
 
 
@@ -208,3 +208,150 @@ def test_remove_task_line_handles_flat_task():
 
     assert updated == """- [ ] Task two
 """
+
+
+def test_split_task_block_matches_block_and_removal():
+    content = """## Objectives
+- [ ] Parent objective
+  - [ ] Child one
+
+  - [ ] Child two
+- [ ] Sibling objective
+"""
+
+    block, remaining = split_task_block(content, "- [ ] Parent objective", 2)
+
+    assert block == task_line_block(content, "- [ ] Parent objective", 2)
+    assert remaining == remove_task_line(content, "- [ ] Parent objective", 2)
+    assert split_task_block(content, "- [ ] Parent objective", 3) is None
+
+
+def test_remove_task_lines_matches_sequential_bottom_up_removal():
+    content = """## Board
+- [x] Done parent
+  - [x] Done child
+- [ ] Open task
+- [x] Done flat
+- [ ] Another open
+"""
+    targets = [("- [x] Done parent", 2), ("  - [x] Done child", 3), ("- [x] Done flat", 5), ("- [x] Gone", 6)]
+
+    def sequential(board, pairs):
+        removed = 0
+        for raw_line, line_number in sorted(pairs, key=lambda t: t[1], reverse=True):
+            updated = remove_task_line(board, raw_line, line_number)
+            if updated is not None:
+                board = updated
+                removed += 1
+        return board, removed
+
+    assert remove_task_lines(content, targets) == sequential(content, targets) == (
+        "## Board\n- [ ] Open task\n- [ ] Another open\n",
+        3,
+    )
+    assert remove_task_lines(content, [("- [x] Gone", 6)]) == (content, 0)
+
+    # The parent's block is measured after its child is gone, so the blank
+    # line that only belonged to the block through the child stays behind.
+    spaced = "- [x] Parent\n\n  - [x] Child\n- [ ] Next\n"
+    spaced_targets = [("- [x] Parent", 1), ("  - [x] Child", 3)]
+    assert remove_task_lines(spaced, spaced_targets) == sequential(spaced, spaced_targets) == ("\n- [ ] Next\n", 2)
+
+
+def test_offset_block_edits_match_line_split_reference():
+    import random
+
+    from task_lines import _block_bounds, replace_task_line
+
+    rng = random.Random(5)
+    shapes = ["- [ ] Task", "- [x] Task", "  - [ ] Child", "    note", "", "  ", "## Head", "- [ ] Task id::a"]
+    for _ in range(300):
+        content = "\n".join(rng.choice(shapes) for _ in range(rng.randint(0, 9)))
+        if rng.random() < 0.5:
+            content += "\n"
+        lines = content.split("\n")
+        for line_number in range(0, len(lines) + 2):
+            for raw_line in {*lines, "- [ ] Task", "Task"}:
+                bounds = _block_bounds(lines, raw_line, line_number)
+                if bounds is None:
+                    expected_block = expected_rest = expected_replaced = None
+                else:
+                    start, end = bounds
+                    expected_block = "\n".join(lines[start:end])
+                    expected_rest = "\n".join(lines[:start] + lines[end:])
+                    expected_replaced = "\n".join(lines[:start] + ["X"] + lines[start + 1:])
+                assert task_line_block(content, raw_line, line_number) == expected_block
+                assert remove_task_line(content, raw_line, line_number) == expected_rest
+                assert replace_task_line(content, raw_line, "X", line_number) == expected_replaced
+                split = split_task_block(content, raw_line, line_number)
+                assert split == (None if bounds is None else (expected_block, expected_rest))
+
+
+def test_inline_fields_only_read_markers_not_glued_to_words():
+    content = "\n".join([
+        "## 🔴 High Priority",
+        "- [ ] **Glued** xarea:: nope owner:: Sam Lee",
+        "- [ ] **Empty** area:: owner:: Pat recur:: weekly 🗓️ 2026-03-02",
+        "- [ ] **Nested** area:: a::b type:: chore goal:: [[Q1 Goals]] task_id:: tsk_1 id:: old-1",
+        "- [ ] **Plain** nothing to see here",
+    ])
+    tasks = parse_tasks(content, format="obsidian")["all"]
+    glued, empty, nested, plain = tasks
+    assert (glued["area"], glued["owner"]) == (None, "Sam Lee")
+    assert (empty["area"], empty["owner"], empty["recur"]) == (None, "Pat", "weekly")
+    assert (nested["area"], nested["type"], nested["goal"]) == (None, "chore", "[[Q1 Goals]]")
+    assert (nested["task_id"], nested["legacy_id"]) == ("tsk_1", "old-1")
+    assert all(plain[key] is None for key in ("area", "owner", "goal", "type", "task_id", "legacy_id"))
+
+
+def test_due_today_uses_local_day_and_skips_done(monkeypatch):
+    from datetime import date
+
+    import cos_config
+
+    monkeypatch.setattr(cos_config, "local_today", lambda: date(2026, 6, 19))
+    content = "\n".join([
+        "## 🔴 High Priority",
+        "- [ ] **Due** 🗓️ 2026-06-19",
+        "- [x] **Done** 🗓️ 2026-06-19",
+        "- [ ] **Later** 🗓️ 2026-06-20",
+        "- [ ] **Bogus** 🗓️ 2026-02-30",
+    ])
+    due_today = parse_tasks(content, format="obsidian")["due_today"]
+    assert [task["title"] for task in due_today] == ["Due"]
+
+
+def test_section_emoji_headers_map_per_board_kind():
+    content = "\n".join([
+        "## 🟡 This Week",
+        "- [ ] Weekly",
+        "## 👥 Team",
+        "- [ ] Delegated",
+        "## Notes without emoji",
+        "- [ ] Still team on work boards",
+    ])
+    work = parse_tasks(content, format="obsidian")["all"]
+    personal = parse_tasks(content, personal=True, format="obsidian")["all"]
+    assert [task["section"] for task in work] == ["q2", "team", "team"]
+    assert [task["section"] for task in personal] == ["q2", None, None]
+
+
+def test_unpadded_due_line_still_counts_as_a_due_date():
+    import pytest
+
+    from utils import check_due_date, get_missed_tasks_bucketed, parse_due_date
+
+    content = "\n".join([
+        "## 🔴 High Priority",
+        "- [ ] **Hand-written due**",
+        "  - Due: 2026-3-1",
+    ])
+    tasks_data = parse_tasks(content, format="obsidian")
+    (task,) = tasks_data["all"]
+    assert task["due"] == "2026-3-1"
+    assert parse_due_date("2026-3-1").isoformat() == "2026-03-01"
+    assert check_due_date(task["due"], "overdue", today=parse_due_date("2026-03-02"))
+    buckets = get_missed_tasks_bucketed(tasks_data, reference_date="2026-03-02")
+    assert buckets["yesterday"] == [task]
+    with pytest.raises(ValueError):
+        parse_due_date("20260301")
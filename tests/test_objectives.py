@@ -59,6 +59,19 @@ def test_cmd_objectives_json_output(monkeypatch, capsys):
     assert deal["completion_pct"] == pytest.approx(0.0)
 
 
+def test_dump_json_matches_stdlib_encoder_on_every_host():
+    from utils import dump_json
+
+    payload = {
+        "path": "/tmp/nope\udcff.md",
+        "title": "Café résumé 🗓️",
+        "ratio": float("nan"),
+        "big": 1e16,
+    }
+    assert dump_json(payload) == json.dumps(payload, indent=2)
+    assert "\\udcff" in dump_json(payload)
+
+
 def test_cmd_objectives_at_risk_filter(monkeypatch, capsys):
     tasks_data = parse_tasks(OBJECTIVES_CONTENT)
     monkeypatch.setattr(
@@ -22,6 +22,7 @@ from parking_lot import (
     list_stale,
     add_item,
     promote_item,
+    promote_items,
     drop_item,
 )
 
@@ -248,6 +249,36 @@ def test_promote_item_moves_child_lines_with_parent(tmp_path):
     assert 'child note that must move' not in parking_lot_part
 
 
+@pytest.mark.parametrize('count', [1, 2, 5])
+def test_promote_items_matches_sequential_promote_item(tmp_path, monkeypatch, count):
+    def counter_ids():
+        ids = iter(range(1000))
+        return lambda: f"tsk_{next(ids):016x}"
+
+    sequential = tmp_path / 'sequential.md'
+    sequential.write_text(SAMPLE_CONTENT)
+    monkeypatch.setattr(parking_lot, '_new_task_id', counter_ids())
+    expected = []
+    for _ in range(count):
+        out = promote_item(sequential, 1)
+        if not out.startswith('✅'):
+            break
+        expected.append(out)
+
+    batched = tmp_path / 'batched.md'
+    batched.write_text(SAMPLE_CONTENT)
+    monkeypatch.setattr(parking_lot, '_new_task_id', counter_ids())
+    assert promote_items(batched, count) == expected
+    assert batched.read_text() == sequential.read_text()
+
+
+def test_promote_items_leaves_board_untouched_when_nothing_promoted(tmp_path, monkeypatch):
+    f = tmp_path / 'tasks.md'
+    f.write_text('# Tasks\n\n## 🅿️ Parking Lot\n\n## ✅ Done\n')
+    monkeypatch.setattr(parking_lot, '_atomic_write', lambda *_args: pytest.fail('board rewritten'))
+    assert promote_items(f, 3) == []
+
+
 def test_drop_nonexistent_item(tasks_file):
     result = drop_item(tasks_file, 99)
     assert '❌' in result
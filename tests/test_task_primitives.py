@@ -257,6 +257,26 @@ def test_ingest_daily_log_unreadable_file_returns_json_envelope(tmp_path):
     assert "Traceback" not in proc.stderr
 
 
+def test_ingest_daily_log_undecodable_path_still_returns_json_envelope(tmp_path):
+    work = _write_work_file(tmp_path)
+    env = _env(tmp_path, work)
+    missing = os.fsencode(tmp_path) + b"/nope\xff.md"
+
+    proc = subprocess.run(
+        [b"python3", b"scripts/tasks.py", b"ingest-daily-log", b"--file", missing],
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+    )
+
+    assert proc.returncode == 2
+    payload = json.loads(proc.stdout)
+    assert payload["error"]["code"] == "input-file-unreadable"
+    assert payload["source"]["path"].endswith("nope\udcff.md")
+    assert proc.stdout.isascii()
+
+
 def test_fallback_task_ids_are_unique_and_consistent_across_primitives(tmp_path):
     work = _write_duplicate_title_work_file(tmp_path)
     env = _env(tmp_path, work)
@@ -358,3 +378,51 @@ def test_ingest_daily_log_disambiguates_cross_repo_issue_urls(tmp_path):
     assert payload["items"][0]["match_metadata"]["decision"] == "evidence-link"
     assert payload["items"][0]["match_metadata"]["match_type"] == "exact-id-or-link"
     assert payload["items"][0]["canonical_task"]["title"] == "Repo B issue 42"
+
+
+def test_summaries_without_notes_dir_use_board_completions(tmp_path):
+    today = date.today()
+    overdue = (today - timedelta(days=3)).isoformat()
+    work = tmp_path / "Weekly TODOs.md"
+    work.write_text(
+        f"""# Weekly TODOs
+
+## 🔴 Q1
+- [ ] **Chase invoice** task_id::tsk_chase 🗓️{overdue} area:: Finance
+- [x] **Closed deal** task_id::tsk_deal area:: Sales ✅ {today.isoformat()}
+"""
+    )
+    env = _env(tmp_path, work)
+    del env["TASK_TRACKER_DAILY_NOTES_DIR"]
+
+    standup = subprocess.run(
+        ["python3", "scripts/tasks.py", "standup-summary"],
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+    )
+    assert standup.returncode == 0, standup.stderr
+    standup_payload = json.loads(standup.stdout)
+    assert [item["title"] for item in standup_payload["dones"]] == ["Closed deal"]
+    assert [item["task_id"] for item in standup_payload["dos"]] == ["tsk_chase"]
+    assert standup_payload["overdue"] == standup_payload["dos"]
+
+    weekly = subprocess.run(
+        [
+            "python3",
+            "scripts/tasks.py",
+            "weekly-review-summary",
+            "--start",
+            (today - timedelta(days=6)).isoformat(),
+            "--end",
+            today.isoformat(),
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+        env=env,
+    )
+    assert weekly.returncode == 0, weekly.stderr
+    done_items = json.loads(weekly.stdout)["DONE"]["items"]
+    assert [(item["task_id"], item["completed_date"]) for item in done_items] == [("tsk_deal", today.isoformat())]
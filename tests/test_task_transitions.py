@@ -7,6 +7,8 @@ from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
 
@@ -1068,6 +1070,32 @@ def test_revert_completion_round_trip_non_recurring(tmp_path, monkeypatch):
     assert post_done_count == pre_done_count
 
 
+def test_repeat_complete_noop_reuses_resolution_records(tmp_path, monkeypatch):
+    work = tmp_path / "Work Tasks.md"
+    work.write_text("""# Work
+
+## 🔴 Q1
+- [ ] **Ship milestone** task_id::tsk_ship area:: Delivery
+""")
+    env = _env(tmp_path, work)
+    _apply_env(monkeypatch, env, work)
+    assert task_transitions.complete_by_id("tsk_ship")["ok"] is True
+
+    calls = []
+    real_load_records = task_transitions.load_records
+
+    def counting_load_records(personal=False):
+        calls.append(personal)
+        return real_load_records(personal)
+
+    monkeypatch.setattr(task_transitions, "load_records", counting_load_records)
+    noop = task_transitions.complete_by_id("tsk_ship")
+
+    assert noop["noop"] is True
+    assert noop["reason"] == "already-done"
+    assert len(calls) == 1
+
+
 def test_revert_completion_restores_indented_child_block(tmp_path, monkeypatch):
     work = tmp_path / "Work Tasks.md"
     original = """# Work
@@ -1594,3 +1622,18 @@ def test_restore_snapshots_crash_mid_restore_leaves_target_intact(tmp_path, monk
     err = task_transitions._restore_after_failure({target: (True, "SNAPSHOT\n")})
     assert err is not None
     assert target.read_text() == current
+
+
+@pytest.mark.parametrize(
+    ("raw_line", "expected"),
+    [
+        ("- [ ] **Pay rent** 🗓️2026-05-01 recur::monthly", "- [ ] **Pay rent** 🗓️2026-06-01 recur::monthly"),
+        ("- [ ] **Pay rent** 🗓️ 2026-05-01 🗓️2026-05-09", "- [ ] **Pay rent** 🗓️2026-06-01 🗓️2026-05-09"),
+        ("- [ ] **Pay rent** 🗓️tbd 🗓️2026-05-01", "- [ ] **Pay rent** 🗓️tbd 🗓️2026-06-01"),
+        ("- [ ] **Pay rent** 📅  2026-05-01", "- [ ] **Pay rent** 📅 2026-06-01"),
+        ("- [ ] **Pay rent** area:: Home", "- [ ] **Pay rent** 🗓️2026-06-01 area:: Home"),
+        ("- [ ] **Pay rent**  ", "- [ ] **Pay rent** 🗓️2026-06-01"),
+    ],
+)
+def test_set_due_date_replaces_first_due_marker(raw_line, expected):
+    assert task_transitions._set_due_date(raw_line, "2026-06-01") == expected
@@ -199,3 +199,369 @@ def test_add_task_warns_when_no_anchor_found(tmp_path, monkeypatch, capsys):
     out = capsys.readouterr().out
     assert "⚠️ Could not find section matching" in out
     assert "Orphan task" not in tasks_file.read_text()
+
+
+def test_requested_command_skips_global_flags():
+    assert tasks._requested_command(['--personal', 'list', '--status', 'open']) == 'list'
+    assert tasks._requested_command(['parking-lot', 'add', 'x']) == 'parking-lot'
+    assert tasks._requested_command(['-h', 'list']) is None
+    assert tasks._requested_command(['bogus']) is None
+    assert tasks._requested_command([]) is None
+
+
+def test_build_parser_registers_only_requested_subcommand():
+    parser = tasks._build_parser('list')
+    subparsers = next(a for a in parser._actions if a.dest == 'command')
+    assert list(subparsers.choices) == list(tasks._SUBCOMMANDS)
+    configured = [name for name, sub in subparsers.choices.items() if len(sub._actions) > 1]
+    assert configured == ['list']
+
+    args = parser.parse_args(['--personal', 'list', '--status', 'done'])
+    assert args.personal is True
+    assert args.status == 'done'
+    assert args.func == 'list_tasks'
+
+
+def test_build_parser_without_command_lists_every_subcommand_unconfigured(capsys):
+    parser = tasks._build_parser()
+    subparsers = next(a for a in parser._actions if a.dest == 'command')
+    assert list(subparsers.choices) == list(tasks._SUBCOMMANDS)
+    assert all(len(sub._actions) == 1 for sub in subparsers.choices.values())
+
+    with pytest.raises(SystemExit) as exc:
+        tasks.main(['--help'])
+    assert exc.value.code == 0
+    out = capsys.readouterr().out
+    assert 'promote-from-backlog' in out
+    assert 'Review stale backlog items' in out
+
+
+def test_subcommand_usage_error_matches_top_level_usage(capsys):
+    with pytest.raises(SystemExit) as exc:
+        tasks.main(['list', '--bogus'])
+    assert exc.value.code == 2
+    usage = tasks._build_parser().format_usage()
+    assert capsys.readouterr().err.startswith(usage)
+    assert '{' + ','.join(tasks._SUBCOMMANDS) + '}' in usage
+
+
+@pytest.mark.parametrize('command', list(tasks._SUBCOMMANDS))
+def test_every_subcommand_configures_a_handler_or_nested_commands(command):
+    parser = tasks._build_parser(command)
+    sub = next(a for a in parser._actions if a.dest == 'command').choices[command]
+    nested = [a for a in sub._actions if isinstance(a, tasks.argparse._SubParsersAction)]
+    assert sub.get_default('func') is not None or nested
+
+
+def test_review_backlog_stale_days_defaults_from_env_at_dispatch(tmp_path, monkeypatch, capsys):
+    tasks_file = tmp_path / 'Work Tasks.md'
+    tasks_file.write_text("""# Weekly Objectives
+
+## 🅿️ Parking Lot
+
+- [ ] **Old idea** #Dev created::2000-01-01
+""")
+    monkeypatch.setattr(tasks, 'get_tasks_file', lambda personal=False: (tasks_file, 'markdown'))
+    monkeypatch.setenv('PARKING_LOT_STALE_DAYS', '999999')
+
+    args = tasks._build_parser('review-backlog').parse_args(['review-backlog'])
+    assert args.stale_days is None
+    tasks.cmd_review_backlog(args)
+    assert 'threshold: 999999d' in capsys.readouterr().out
+    assert os.environ['PARKING_LOT_STALE_DAYS'] == '999999'
+
+
+@pytest.mark.parametrize('argv, handler', [
+    (['completion-candidates', 'list'], 'cmd_completion_candidates'),
+    (['completion-candidates', 'snooze', 'cand_1', '--until', '2026-01-01'], 'cmd_completion_candidates'),
+    (['parking-lot', 'stale'], 'cmd_parking_lot'),
+    (['parking-lot', 'drop', '2'], 'cmd_parking_lot'),
+    (['delegated', 'take-back', '3'], 'cmd_delegated'),
+    (['calendar', 'sync'], 'cmd_calendar_sync'),
+    (['calendar', 'resolve'], 'cmd_calendar_resolve'),
+])
+def test_nested_subcommands_dispatch_to_group_handler(argv, handler):
+    args = tasks._build_parser(argv[0]).parse_args(argv)
+    assert args.func == handler
+    assert callable(getattr(tasks, handler))
+
+
+def test_build_parser_is_cached_per_command():
+    assert tasks._build_parser('list') is tasks._build_parser('list')
+    assert tasks._build_parser('list') is not tasks._build_parser('add')
+    assert tasks._build_parser() is not tasks._build_parser('list')
+
+
+def test_cached_parser_dispatches_to_patched_handler(monkeypatch):
+    tasks._build_parser('blockers')
+    calls = []
+    monkeypatch.setattr(tasks, 'show_blockers', calls.append)
+    tasks.main(['blockers'])
+    assert [args.command for args in calls] == ['blockers']
+
+
+@pytest.mark.parametrize('argv', [
+    ['promote-from-backlog'],
+    ['promote-from-backlog', '--cap', '3'],
+    ['--personal', 'promote-from-backlog', '--cap=2'],
+])
+def test_promote_from_backlog_fast_path_matches_argparse(argv):
+    fast = tasks._promote_from_backlog_fast_args(argv)
+    assert fast == tasks._build_parser('promote-from-backlog').parse_args(argv)
+
+
+@pytest.mark.parametrize('argv', [
+    ['promote-from-backlog', '--cap'],
+    ['promote-from-backlog', '--cap', '-1'],
+    ['promote-from-backlog', '--cap', 'two'],
+    ['promote-from-backlog', '--ca', '2'],
+    ['promote-from-backlog', '-h'],
+    ['review-backlog'],
+])
+def test_promote_from_backlog_fast_path_defers_other_shapes_to_argparse(argv):
+    assert tasks._promote_from_backlog_fast_args(argv) is None
+
+
+def test_nested_subparsers_inherit_cached_width_formatter():
+    parser = tasks._build_parser('completion-candidates')
+    group = next(a for a in parser._actions if a.dest == 'command').choices['completion-candidates']
+    leaf = next(a for a in group._actions if a.dest == 'candidate_command').choices['snooze']
+    assert leaf.formatter_class is tasks._HelpFormatter
+    assert '--until UNTIL' in leaf.format_usage()
+
+
+def test_list_tasks_applies_all_filters_in_one_pass(monkeypatch, capsys):
+    from datetime import datetime, timedelta
+    import cos_config
+
+    today = cos_config.local_today()
+    recent = datetime.now().date().isoformat()
+    old = (datetime.now().date() - timedelta(days=90)).isoformat()
+    all_tasks = [
+        {'title': 'Open urgent due today', 'done': False, 'section': 'q2', 'priority': 'urgent', 'due': today.isoformat()},
+        {'title': 'Open high no due', 'done': False, 'section': 'q1', 'priority': None},
+        {'title': 'Open medium due today', 'done': False, 'section': 'q2', 'priority': 'medium', 'due': today.isoformat()},
+        {'title': 'Done high recent', 'done': True, 'section': 'q1', 'completed_date': recent},
+        {'title': 'Done high old', 'done': True, 'section': 'q1', 'completed_date': old},
+        {'title': 'Done high bad date', 'done': True, 'section': 'q1', 'completed_date': 'soon'},
+    ]
+    monkeypatch.setattr(tasks, 'load_tasks', lambda personal=False: (None, {'all': all_tasks}))
+    monkeypatch.delenv('TASK_TRACKER_DAILY_NOTES_DIR', raising=False)
+
+    def run(**overrides):
+        args = SimpleNamespace(personal=False, status=None, priority=None, due=None, completed_since=None)
+        for key, value in overrides.items():
+            setattr(args, key, value)
+        tasks.list_tasks(args)
+        return capsys.readouterr().out
+
+    out = run(status='open', priority='high', due='today')
+    assert 'Open urgent due today' in out
+    assert 'Open high no due' not in out
+    assert 'Open medium due today' not in out
+
+    out = run(priority='high', completed_since='7d')
+    assert '(1 items)' in out
+    assert 'Done high recent' in out
+
+
+@pytest.mark.parametrize('line, key', [
+    ('- ✅ **Ship it** [Ops] ✅ 2026-01-05', ('ship it', '2026-01-05')),
+    ('- ✅ **Ship it**  ✅2026-01-05  ', ('ship it', '2026-01-05')),
+    ('- ✅ **Ship it**', ('ship it', '')),
+    ('- ✅ **Ship it** ✅ 2026-1-05', ('ship it', '')),
+    ('- ✅ ****bold**', ('**bold', '')),
+    ('- ✅ **unterminated', None),
+    ('## Archived 2026-01-05 (Work)', None),
+])
+def test_archive_entry_key(line, key):
+    assert tasks._archive_entry_key(line) == key
+
+
+def test_archive_done_appends_new_entries_and_skips_archived(tmp_path, monkeypatch, capsys):
+    from datetime import datetime
+
+    notes_dir = tmp_path / 'notes'
+    notes_dir.mkdir()
+    today = datetime.now().date().isoformat()
+    (notes_dir / f'{today}.md').write_text('- 09:15 ✅ Ship release notes\n- 10:00 ✅ Close vendor ticket\n')
+    archive_dir = tmp_path / 'archive'
+    tasks_file = tmp_path / 'Work Tasks.md'
+    tasks_file.write_text('# Weekly Objectives\n')
+
+    monkeypatch.setenv('TASK_TRACKER_DAILY_NOTES_DIR', str(notes_dir))
+    monkeypatch.setattr(tasks, 'ARCHIVE_DIR', archive_dir)
+    monkeypatch.setattr(tasks, 'get_current_quarter', lambda: '2026-Q1')
+    monkeypatch.setattr(tasks, 'get_tasks_file', lambda personal=False: (tasks_file, 'obsidian'))
+
+    archive_dir.mkdir()
+    archive_file = archive_dir / 'ARCHIVE-2026-Q1.md'
+    archive_file.write_text(f'# Task Archive - 2026-Q1\n\n- ✅ **Ship release notes** ✅ {today}\n')
+
+    tasks.archive_done(SimpleNamespace(personal=False))
+    assert 'Archived 1 Work tasks' in capsys.readouterr().out
+    content = archive_file.read_text()
+    assert content.startswith(f'# Task Archive - 2026-Q1\n\n- ✅ **Ship release notes** ✅ {today}\n')
+    assert content.count('Ship release notes') == 1
+    assert f'- ✅ **Close vendor ticket** ✅ {today}\n' in content
+
+    tasks.archive_done(SimpleNamespace(personal=False))
+    assert 'already archived' in capsys.readouterr().out
+    assert archive_file.read_text() == content
+
+
+@pytest.mark.parametrize('content, expected', [
+    ('## Q1\n- [ ] **A**\n', '## Q1\nNEW\n- [ ] **A**\n'),
+    ('## Q1\n\n## Q2\n', '## Q1\n\n## Q2\nNEW\n'),
+    ('## Q1\n## Q2', '## Q1\n## Q2\nNEW'),
+    ('# Title\ntext\n', 'NEW\n# Title\ntext\n'),
+    ('', 'NEW\n'),
+])
+def test_insert_before_first_task(content, expected):
+    assert tasks._insert_before_first_task(content, 'NEW') == expected
+
+
+@pytest.mark.parametrize('raw, expected', [
+    ('- [ ] **Sync** meeting::true', []),
+    ('- [ ] **Sync** meeting::true status::Blocked', ['blocked']),
+    ('- [ ] **Sync** status::tbd meeting::true status::done', ['done']),
+    ('- [ ] **Sync** meeting::true status::canceled status::scheduled', ['canceled', 'scheduled']),
+])
+def test_meeting_statuses(raw, expected):
+    raw_l = raw.lower()
+    statuses = tasks._meeting_statuses(raw_l)
+    assert statuses == expected
+    for value in ('scheduled', 'done', 'canceled', 'blocked'):
+        assert (value in statuses) == (f'status::{value}' in raw_l)
+
+
+@pytest.mark.parametrize('raw, title, expected', [
+    ('- [ ] **sync** meeting::true depends::tsk_a', 'Sync', 'blocked'),
+    ('- [ ] **1:1** meeting::true #private', '1:1', 'private'),
+    ('- [ ] **focus** meeting::true', 'Focus BUFFER', 'buffer'),
+    ('- [ ] **standup** meeting::true', None, 'normal'),
+])
+def test_calendar_classification(raw, title, expected):
+    assert tasks._calendar_classification(raw.lower(), title) == expected
+
+
+def test_list_tasks_completed_since_merges_note_completions_by_title(monkeypatch, capsys, tmp_path):
+    from datetime import datetime
+    import daily_notes
+
+    recent = datetime.now().date().isoformat()
+    board_done = {'title': 'Ship Release', 'done': True, 'section': 'q1', 'completed_date': recent}
+    note_done = [
+        {'title': 'ship release', 'done': True, 'section': 'done'},
+        {'title': 'Call vendor', 'done': True, 'section': 'done'},
+    ]
+    monkeypatch.setattr(tasks, 'load_tasks', lambda personal=False: (None, {'all': [board_done]}))
+    monkeypatch.setattr(daily_notes, 'extract_completed_tasks', lambda **_kwargs: note_done)
+    monkeypatch.setenv('TASK_TRACKER_DAILY_NOTES_DIR', str(tmp_path))
+
+    tasks.list_tasks(SimpleNamespace(personal=False, status='done', priority=None, due=None, completed_since='7d'))
+    out = capsys.readouterr().out
+    assert '(2 items)' in out
+    assert 'Ship Release' in out
+    assert 'Call vendor' in out
+
+
+def test_group_tasks_orders_keys_case_insensitively_and_labels_sections():
+    items = [
+        {'title': 'a', 'area': 'ops', 'section': 'parking_lot'},
+        {'title': 'b', 'area': 'Infra', 'section': 'q1'},
+        {'title': 'c', 'area': None, 'section': 'custom'},
+        {'title': 'd', 'area': 'Ops', 'section': None},
+    ]
+    by_area = tasks._group_tasks_by_area(items)
+    assert list(by_area) == ['Infra', 'ops', 'Ops', 'Uncategorized']
+    by_category = tasks._group_tasks_by_category(items)
+    assert list(by_category) == ['custom', 'Parking Lot', 'Q1', 'Uncategorized']
+    assert [t['title'] for t in by_category['Parking Lot']] == ['a']
+
+
+def test_calendar_sync_primitive_partitions_meetings_by_lifecycle(monkeypatch, capsys):
+    import json
+    import evidence_matching
+    import standup_common
+
+    def record(title, raw, done=False):
+        return SimpleNamespace(
+            raw_line=raw, done=done, title=title, canonical_id=f'tsk_{title}',
+            fallback_id=None, missing_task_id=False, fallback_only=False,
+        )
+
+    records = [
+        record('a', '- [ ] **a** meeting::true'),
+        record('b', '- [x] **b** meeting::true', done=True),
+        record('c', '- [ ] **c** meeting::true status::blocked'),
+        record('d', '- [ ] **d** meeting::true status::canceled'),
+        record('e', '- [ ] **e** meeting::true'),
+        record('f', '- [ ] **f** no meeting'),
+    ]
+    monkeypatch.setattr(evidence_matching, 'safe_load_task_records', lambda personal: records)
+    monkeypatch.setattr(standup_common, 'get_calendar_events', lambda: [])
+
+    tasks.cmd_calendar_sync_primitive(SimpleNamespace(personal=False))
+    payload = json.loads(capsys.readouterr().out)
+    lifecycle = payload['lifecycle_map']
+    assert list(lifecycle) == ['scheduled', 'done', 'blocked', 'canceled']
+    assert [m['title'] for m in lifecycle['scheduled']] == ['a', 'e']
+    assert [m['title'] for m in lifecycle['done']] == ['b']
+    assert [m['title'] for m in lifecycle['blocked']] == ['c']
+    assert [m['title'] for m in lifecycle['canceled']] == ['d']
+    assert payload['meetings_seen'] == 5
+
+
+def test_legacy_task_row_falls_back_to_legacy_id_and_department():
+    row = tasks._legacy_task_row({'legacy_id': 'old-7', 'title': 'Ship', 'department': 'Ops', 'done': 1})
+    assert row['task_id'] == 'old-7'
+    assert row['missing_task_id'] is True
+    assert row['fallback_only'] is False
+    assert row['area'] == 'Ops'
+    assert row['done'] is True
+    bare = tasks._legacy_task_row({})
+    assert (bare['task_id'], bare['fallback_only'], bare['area'], bare['title']) == (None, True, 'Uncategorized', '')
+
+
+@pytest.mark.parametrize('content, priority, area, expected', [
+    (
+        '# Board\n## 🔴 High\n\n**Focus**\n> note\n- [ ] **Old**\n',
+        'high', None,
+        '# Board\n## 🔴 High\n\n**Focus**\n> note\n- [ ] **New**\n- [ ] **Old**\n',
+    ),
+    ('## 🟡 Medium', 'medium', None, '## 🟡 Medium\n- [ ] **New**\n'),
+    ('## 🔴 High\n**Focus**', 'high', None, '## 🔴 High\n**Focus**\n- [ ] **New**\n'),
+    ('## All Tasks\n### Sales', 'high', 'sales', '## All Tasks\n### Sales\n- [ ] **New**\n'),
+    ('## 🟡 Medium\n\n', 'medium', None, '## 🟡 Medium\n\n- [ ] **New**\n'),
+    (
+        '## All Tasks\n### Ops\n- [ ] **A**\n### Sales\n\n- [ ] **B**\n## Done\n',
+        'high', 'sales',
+        '## All Tasks\n### Ops\n- [ ] **A**\n### Sales\n\n- [ ] **New**\n- [ ] **B**\n## Done\n',
+    ),
+    ('## Done\n### Ops\n', 'low', None, '## Done\n### Ops\n- [ ] **New**\n'),
+    ('# Nothing here\n', 'low', None, None),
+])
+def test_insert_active_task_anchors(content, priority, area, expected):
+    assert tasks._insert_active_task(content, priority, area, '- [ ] **New**') == expected
+
+
+def test_list_tasks_completed_since_no_notes_skips_daily_notes(monkeypatch, capsys, tmp_path):
+    from datetime import datetime
+    import daily_notes
+
+    recent = datetime.now().date().isoformat()
+    board_done = {'title': 'Ship Release', 'done': True, 'section': 'q1', 'completed_date': recent}
+    monkeypatch.setattr(tasks, 'load_tasks', lambda personal=False: (None, {'all': [board_done]}))
+
+    def fail(**_kwargs):
+        raise AssertionError('daily notes should not be scanned with --no-notes')
+
+    monkeypatch.setattr(daily_notes, 'extract_completed_tasks', fail)
+    monkeypatch.setenv('TASK_TRACKER_DAILY_NOTES_DIR', str(tmp_path))
+
+    args = tasks._build_parser('list').parse_args(['list', '--status', 'done', '--completed-since', '24h', '--no-notes'])
+    tasks.list_tasks(args)
+    out = capsys.readouterr().out
+    assert '(1 items)' in out
+    assert 'Ship Release' in out
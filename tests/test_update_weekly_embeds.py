@@ -147,3 +147,38 @@ class TestUpdateOrAppendProgressSection:
         # Second update (should produce same content)
         result2 = embeds.update_or_append_progress_section(result1, new_section)
         assert result1 == result2
+
+    def test_section_splice_matches_regex_reference(self):
+        import random
+        import re
+
+        reference_re = re.compile(
+            r"(^## 📊 Daily Progress\s*\n)(.*?)(?=^##\s|\Z)", re.MULTILINE | re.DOTALL
+        )
+        pieces = [
+            "## 📊 Daily Progress", "## 📊 Daily Progress  ", "x ## 📊 Daily Progress",
+            "## 📊 Daily Progress extra", "### Monday", "![[a#Done]]", "", "  ", "##",
+            "## Next", "##\tTabbed", "###", "text", "## 📋 Tasks Query",
+        ]
+        rng = random.Random(3)
+        for _ in range(2000):
+            content = "\n".join(rng.choice(pieces) for _ in range(rng.randint(0, 8)))
+            if rng.random() < 0.5:
+                content += "\n"
+            match = reference_re.search(content)
+            expected = None if match is None else (match.start(), match.end())
+            assert embeds._progress_section_span(content) == expected, content
+
+
+def test_build_progress_section_exact_layout():
+    section = embeds.build_progress_section(date(2026, 2, 16))
+    prefix = embeds.VAULT_PREFIX
+    assert section.split("\n")[:6] == [
+        "## 📊 Daily Progress",
+        "",
+        "### Monday",
+        f"![[{prefix}/2026-02-16#Done]]",
+        "",
+        "### Tuesday",
+    ]
+    assert section.endswith(f"### Friday\n![[{prefix}/2026-02-20#Done]]\n")